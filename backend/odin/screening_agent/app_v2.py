@@ -21,6 +21,7 @@ from odin.screening_agent.call_3cx_client import make_call, poll_call_answered,
 
 
 AGENT_START_DELAY = 2.0
+SESSION_WAIT_MAX = 30.0  # Longest a /wait request is held open, in seconds
 
 # For testing
 TEST_MODE = False  # Set to true to use test phone number (as the caller number)
@@ -32,7 +33,7 @@ app = Flask(__name__)
 class QuietStatusFilter(logging.Filter):
     def filter(self, record):
         msg = record.getMessage()
-        return '/status' not in msg and '/health' not in msg
+        return '/status' not in msg and '/health' not in msg and '/wait/' not in msg
 
 logging.getLogger('werkzeug').addFilter(QuietStatusFilter())
 
@@ -56,6 +57,7 @@ Endpoints:
   POST /start - Start a screening session
   POST /stop  - Stop a screening session
   GET  /status - Get active sessions
+  GET  /wait/<id> - Wait for a session to end
   GET  /health - Health check
 """
 
@@ -76,6 +78,7 @@ def start_screening():
 
     # Create unique session ID
     stop_event = Event()
+    done_event = Event()  # Set once the session is removed, wakes /wait requests
     session_id = f"{caller_phone}_{int(time.time())}_{uuid.uuid4().hex[:6]}"
 
     # Check if session already exists for this phone
@@ -94,7 +97,8 @@ def start_screening():
         'started_at': time.time(),
         'caller_phone': caller_phone,
         'caller_id': caller_id,
-        'call_status': 'ringing'  # track the state
+        'call_status': 'ringing',  # track the state
+        'done_event': done_event
     }
 
     # NOTE: We make it into a function here so that we can run it on a seperate thread
@@ -116,6 +120,7 @@ def start_screening():
             }
             if session_id in active_sessions:
                 del active_sessions[session_id]
+            done_event.set()
             return
         
         # Call is answered! Store participant info for targeted hangup later
@@ -168,6 +173,7 @@ def start_screening():
 
             if session_id in active_sessions:
                 del active_sessions[session_id]
+            done_event.set()
 
     # Create the thread and assign the function to it
     thread = Thread(target=poll_and_start_agent, daemon=True)
@@ -266,6 +272,29 @@ def status():
     }), 200
 
 
+@app.route('/wait/<session_id>', methods=['GET'])
+def wait_for_session(session_id):
+    """
+    Long-poll: hold the request until the session ends or the timeout passes.
+    Once ended, the call result is handed over here (and removed) so no /call-result request is needed
+    """
+    try:
+        timeout = min(float(request.args.get('timeout', SESSION_WAIT_MAX)), SESSION_WAIT_MAX)
+    except ValueError:
+        timeout = SESSION_WAIT_MAX
+
+    session = active_sessions.get(session_id)
+    if session is not None:
+        session['done_event'].wait(timeout)
+
+    ended = session_id not in active_sessions
+    return jsonify({
+        'session_id': session_id,
+        'ended': ended,
+        'result': call_results.pop(session_id, None) if ended else None
+    }), 200
+
+
 @app.route('/call-result/<session_id>', methods=['GET'])
 def get_call_result(session_id):
     """Get the result of a completed call and remove it from results"""
@@ -328,6 +357,7 @@ if __name__ == "__main__":
         print("  POST /stop    - Stop a screening session")
         print("  GET  /status  - Get all active sessions")
         print("  GET  /session/<id> - Get specific session details")
+        print("  GET  /wait/<id> - Wait for a session to end")
         print("  GET  /health  - Health check")
         print(f"\nTEST_MODE: {TEST_MODE}")
         print("\nServer running on http://localhost:5000\n")
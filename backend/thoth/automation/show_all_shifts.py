@@ -3,26 +3,30 @@ import asyncio
 
 from thoth.automation.login_playwright import LoginAutomation
 from thoth.automation.staff_lookup import lookup_staff_by_phone, search_staff_shifts_by_name
-from thoth.automation.secrets import get_admin_creds
+from thoth.automation.secrets import get_admin_credentials
+from thoth.automation.website_configs_playwright import get_config
+
+SERVICE_NAME = "hahs_vic3495"
 
 async def main():
-    login = LoginAutomation(use_saved_session=False)
+    # Reuse the admin session saved in .sessions by the last successful login (same one
+    # check_shifts_handler uses), so the login form and 2FA only run once it has expired
+    login = LoginAutomation(use_saved_session=True)
     
-    # Import get configuration from test_integrated_workflow
-    creds = get_admin_creds()
+    creds = get_admin_credentials(SERVICE_NAME)
+    if not creds:
+        print("Admin credentials not available")
+        return
     
-    # Use the same login as test_integrated_workflow
     try:
-        # Get login details from test
         success = await login.login_with_retry(
-            login.auto_login.website_config,  
-            'Ezaango',
-            {
-                'username': creds['username'],
-                'password': creds['password'],
-                'email': creds.get('email', '')
-            }
+            get_config(SERVICE_NAME),
+            f"{SERVICE_NAME}_admin",
+            creds
         )
+        if not success:
+            print("Login failed")
+            return
         
         page = await login.get_page()
         if not page:
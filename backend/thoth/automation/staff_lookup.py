@@ -112,7 +112,8 @@ async def lookup_staff_by_phone(page, phone_number: str) -> Optional[Dict]:
     try:
         # Navigate to staff page
         logger.info(f"Navigating to staff page to lookup phone: {phone_number}")
-        await page.goto("https://hahs-vic3495.ezaango.app/staff/4", wait_until="networkidle")
+        # No networkidle wait, the search input wait below is what tells us the table is ready
+        await page.goto("https://hahs-vic3495.ezaango.app/staff/4", wait_until="domcontentloaded")
         logger.info(f"Page URL after navigation: {page.url}")
         
         # Check if we're still on a login page (indicates authentication failure)
@@ -393,7 +394,9 @@ async def search_staff_shifts_by_name(page, staff_name: str, start_date: str = N
         logger.info(f"Searching for shifts by staff name: {staff_name}")
         logger.info(f"Navigating to: {search_url}")
         
-        await page.goto(search_url, wait_until="networkidle")
+        # "load" lets the page scripts tag the rows (role="row") without also waiting out
+        # networkidle's quiet period, the row wait below covers the rest
+        await page.goto(search_url, wait_until="load")
         logger.info(f"Page URL: {page.url}")
         
         # Wait for results table to load
@@ -9,15 +9,110 @@ sys.path.insert(0, str(backend_root))
 
 
 from flask import Flask, request, jsonify
-from threading import Thread, Event
+from threading import Thread, Event, Lock, Timer
 from thoth.core.call_assistant.call_assistant import CallAssistant
+import heapq
+import itertools
 import time
 import os
 
+CLEAR_SCREEN = "\x1b[2J\x1b[H"  # ANSI erase display + cursor home, no shell needed
+
+if os.name == 'nt':
+    # Let the Windows console interpret ANSI sequences such as CLEAR_SCREEN
+    import ctypes
+    _kernel32 = ctypes.windll.kernel32
+    _stdout_handle = _kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    _console_mode = ctypes.c_uint32()
+    if _kernel32.GetConsoleMode(_stdout_handle, ctypes.byref(_console_mode)):
+        _kernel32.SetConsoleMode(_stdout_handle, _console_mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+
+SESSION_IDLE_TIMEOUT = 900  # Seconds without a transcribed phrase before a session is treated as orphaned and stopped
+REAP_INTERVAL = 60  # Seconds between stale session sweeps
+
 app = Flask(__name__)
 
+
+class SessionRegistry:
+    """
+    Active assistant sessions, shared by the Flask request threads and the assistant threads.
+    Every access takes the lock; a heap ordered by last activity lets reap() find idle sessions
+    without scanning all of them.
+    """
+    def __init__(self):
+        self._sessions = {}
+        self._lock = Lock()
+        # (last_activity, seq, call_id, session), seq breaks ties so sessions are never compared.
+        # Entries of sessions already popped or replaced are skipped by reap()
+        self._heap = []
+        self._seq = itertools.count()
+
+    def add(self, call_id, session) -> bool:
+        """Register a session. False if a session with this call_id is already running"""
+        with self._lock:
+            if call_id in self._sessions:
+                return False
+            self._sessions[call_id] = session
+            heapq.heappush(self._heap, (session['assistant'].last_activity, next(self._seq), call_id, session))
+            return True
+
+    def get(self, call_id):
+        with self._lock:
+            return self._sessions.get(call_id)
+
+    def pop(self, call_id, session) -> bool:
+        """Drop this exact session. A newer session registered under the same call_id is left alone"""
+        with self._lock:
+            if self._sessions.get(call_id) is not session:
+                return False
+            del self._sessions[call_id]
+            return True
+
+    def items(self) -> list:
+        """Snapshot of (call_id, session), safe to iterate while sessions come and go"""
+        with self._lock:
+            return list(self._sessions.items())
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
+
+    def reap(self, idle_for: float) -> list:
+        """Stop and drop sessions with no activity in the last idle_for seconds. Returns their call_ids"""
+        cutoff = time.monotonic() - idle_for
+        reaped = []
+        with self._lock:
+            while self._heap and self._heap[0][0] < cutoff:
+                seen_activity, _seq, call_id, session = heapq.heappop(self._heap)
+                if self._sessions.get(call_id) is not session:
+                    continue  # Already ended, or the call_id now belongs to a newer session
+
+                last_activity = session['assistant'].last_activity
+                if last_activity > seen_activity:
+                    # Active since it was queued, look at it again once it has been idle long enough
+                    heapq.heappush(self._heap, (last_activity, next(self._seq), call_id, session))
+                    continue
+
+                del self._sessions[call_id]
+                reaped.append((call_id, session))
+
+        for call_id, session in reaped:
+            session['stop_event'].set()
+        return [call_id for call_id, _ in reaped]
+
+
 # Store active assistant sessions
-active_sessions = {}
+active_sessions = SessionRegistry()
+
+
+def reap_stale_sessions():
+    """Stop sessions whose call-ended webhook never arrived, then re-arm for the next sweep"""
+    for call_id in active_sessions.reap(SESSION_IDLE_TIMEOUT):
+        print(f"Reaped stale session for call {call_id}")
+
+    timer = Timer(REAP_INTERVAL, reap_stale_sessions)
+    timer.daemon = True
+    timer.start()
 
 
 @app.route('/webhook/call-started', methods=['POST'])
@@ -29,7 +124,7 @@ def call_started():
     if not call_id:
         return jsonify({'error': 'call_id required'}), 400
     
-    if call_id in active_sessions:
+    if active_sessions.get(call_id) is not None:
         return jsonify({'status': 'already running'}), 200
     
     assistant = CallAssistant(caller_phone=caller_phone)
@@ -45,22 +140,27 @@ def call_started():
         finally:
             # Always clean up the session
             print(f"Removing session for call {call_id}")
-            if call_id in active_sessions:
-                del active_sessions[call_id]
+            active_sessions.pop(call_id, session)
 
-            os.system("cls")
+            if sys.stdout.isatty():  # Don't put escape codes into a pipe or log file
+                sys.stdout.write(CLEAR_SCREEN)
+                sys.stdout.flush()
             print(f"Session removed. Active sessions: {len(active_sessions)}")
     
     # Use daemon=True to prevent blocking Flask shutdown
     thread = Thread(target=run_assistant, daemon=True)
-    thread.start()
-    
-    active_sessions[call_id] = {
+
+    # Register before starting, so a session that ends immediately still finds itself to remove
+    session = {
         'assistant': assistant,
         'thread': thread,
         'stop_event': stop_event,
         'started_at': time.time()
     }
+    registered = active_sessions.add(call_id, session)
+    if not registered:
+        return jsonify({'status': 'already running'}), 200
+    thread.start()
     
     return jsonify({
         'status': 'success',
@@ -76,11 +176,11 @@ def call_ended():
     data = request.json
     call_id = data.get('call_id')
     
-    if call_id not in active_sessions:
+    session = active_sessions.get(call_id)
+    if session is None:
         return jsonify({'error': 'No active session found'}), 404
     
     # Get the stop event and signal it
-    session = active_sessions[call_id]
     stop_event = session['stop_event']
     
     # Signal the assistant to stop (non-blocking)
@@ -96,11 +196,12 @@ def call_ended():
 if __name__ == '__main__':
     # Add shutdown handler
     try:
+        reap_stale_sessions()
         app.run(debug=True, port=5000, use_reloader=False)  # disable reloader for cleaner shutdown
     except KeyboardInterrupt:
         print("\nShutting down gracefully...")
         # Stop all active sessions
-        for call_id, session in list(active_sessions.items()):
+        for call_id, session in active_sessions.items():
             session['stop_event'].set()
             session['thread'].join(timeout=5)
         print("All sessions stopped.")
@@ -8,7 +8,7 @@ sys.path.insert(0, str(backend_root))
 
 import asyncio
 import json
-from time import sleep
+from time import sleep, monotonic
 from threading import Event
 from whisper_client.system_audio_whisper_client import SystemAudioWhisperClient
 from ollama_client.llm_client import OllamaClient
@@ -90,6 +90,7 @@ class CallAssistant:
         self.whisper_client: SystemAudioWhisperClient = None
         self.llm_response_array = []
         self.transcript = ""
+        self.last_activity = monotonic()  # Bumped on every completed phrase, app.py reaps sessions idle for too long
 
 
     def on_phrase_complete(self, phrase:str) -> None:
@@ -100,6 +101,7 @@ class CallAssistant:
             phrase (str): the transcript of the recorded phrase
         """
 
+        self.last_activity = monotonic()
         print(f"[PHRASE COMPLETE]\n{phrase}")
         if self.caller_phone:
             print(f"[CALLER PHONE] {self.caller_phone}")
@@ -22,6 +22,7 @@ Key Class:
     ShiftDateReasoner
         Constructor: __init__(model="gemma3:1b")
         Main method: reason_dates(user_query)
+        Batch method: reason_dates_batch(user_queries)
             
 Main Function:
     reason_dates(user_query: str)
@@ -57,6 +58,7 @@ Used By:
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from ollama_client.llm_client import OllamaClient
 
@@ -75,30 +77,30 @@ class ShiftDateReasoner:
     Uses LLM to determine relevant dates for shift queries.
     """
     
-    SYSTEM_PROMPT_TEMPLATE = """You are a shift scheduling assistant. Your job is to interpret shift queries and determine what dates the user is interested in.
+    # Kept identical for every query so Ollama can reuse the cached prefix, the date context
+    # goes in front of each user message instead (see _date_context)
+    SYSTEM_PROMPT = """You are a shift scheduling assistant. Your job is to interpret shift queries and determine what dates the user is interested in.
 
 TASK: Given a user's query about their shifts, output ONLY a JSON object (no other text) with these fields:
-{{
+{
     "is_shift_query": true/false,
     "date_range_type": "today" | "tomorrow" | "week" | "month" | "specific",
     "start_date": "DD-MM-YYYY",
     "end_date": "DD-MM-YYYY",
     "reasoning": "<CNCL>" if cancellation, "<SHOW>" if viewing shifts, followed by brief explanation
-}}
+}
 
 DATE INTERPRETATION RULES:
 - "When is my shift?" or "What shifts do I have?" → today + next 7 days
 - "Tomorrow" → get the date today and add one day
 - "Next week" → 7 days from today
-- "This week" → from TODAY until {this_sunday}
+- "This week" → from TODAY until this Sunday
 - "Next month" → entire next calendar month
 - Specific date mentioned → that date only
 - Default (no date mentioned) → today + next 7 days
 
 IMPORTANT: Always use today's date as reference. Output ONLY the JSON object, no explanation. 
-This Sunday is: {this_sunday}
-
-Today's date: {today} ({day_of_week})
+Each query starts with a [Context: ...] line giving today's date, the day of the week and this Sunday's date.
 """
 
     def __init__(self, model: str = "llama2:latest"):
@@ -144,13 +146,15 @@ Today's date: {today} ({day_of_week})
         
         logger.debug(f"This Sunday: {sunday_dd_mm_yyyy}")
         
-        system_prompt = self.SYSTEM_PROMPT_TEMPLATE.format(
-            today=today_str, 
-            day_of_week=day_of_week,
-            this_sunday=sunday_dd_mm_yyyy
-        )
-        self.llm_client = OllamaClient(model=model, system_prompt=system_prompt)
+        self.llm_client = OllamaClient(model=model, system_prompt=self.SYSTEM_PROMPT)
         self.model = model
+
+    def _date_context(self) -> str:
+        """Date context line put in front of each user query sent to the LLM."""
+        return (
+            f"[Context: Today's date: {self.today.strftime('%Y-%m-%d')} ({self.today.strftime('%A')}). "
+            f"This Sunday is: {self.this_sunday.strftime('%d-%m-%Y')}]\n"
+        )
     
     def _calculate_simple_dates(self, user_query: str):
         """
@@ -277,6 +281,43 @@ Today's date: {today} ({day_of_week})
 
         # Complex query - use LLM
         logger.info(f"Complex query detected, using LLM for date reasoning...")
+        return self._reason_dates_llm(user_query, self.llm_client, retry_on_defaults)
+
+    def reason_dates_batch(self, user_queries: list, retry_on_defaults: bool = True) -> list:
+        """
+        Determine relevant dates for several shift queries at once.
+
+        Simple keywords are still calculated in Python. The remaining queries are sent to
+        Ollama together, each on its own conversation, so the server works on them side by
+        side instead of one round-trip after another.
+
+        Args:
+            user_queries: User questions about shifts
+            retry_on_defaults: Same as reason_dates()
+
+        Returns:
+            One reason_dates() style dict per query, in the same order
+        """
+        results = [self._calculate_simple_dates(query) for query in user_queries]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        logger.info(f"Reasoning dates for {len(pending)} queries with the LLM in parallel...")
+
+        def reason(query):
+            # Conversation history is per client, so parallel queries each get their own
+            llm_client = OllamaClient(model=self.model, system_prompt=self.SYSTEM_PROMPT)
+            return self._reason_dates_llm(query, llm_client, retry_on_defaults)
+
+        with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+            llm_results = pool.map(reason, [user_queries[i] for i in pending])
+            for i, result in zip(pending, llm_results):
+                results[i] = result
+        return results
+
+    def _reason_dates_llm(self, user_query: str, llm_client: OllamaClient, retry_on_defaults: bool) -> dict:
+        """Ask the LLM for the date range of user_query, retrying or falling back to defaults."""
         max_retries = 2 if retry_on_defaults else 1
         attempt = 0
 
@@ -287,18 +328,13 @@ Today's date: {today} ({day_of_week})
                 logger.debug(f"LLM context - Today: {self.today.strftime('%Y-%m-%d')}, This Sunday: {self.this_sunday.strftime('%Y-%m-%d')}")
                 
                 # Verify system prompt is in the conversation
-                history = self.llm_client.get_history()
+                history = llm_client.get_history()
                 if not history or history[0].get('role') != 'system':
                     logger.warning("System prompt missing from LLM history! Re-initializing...")
                     # Reinitialize to restore system prompt
-                    system_prompt = self.SYSTEM_PROMPT_TEMPLATE.format(
-                        today=self.today.strftime("%Y-%m-%d"),
-                        day_of_week=self.today.strftime("%A"),
-                        this_sunday=self.this_sunday.strftime("%d-%m-%Y")
-                    )
-                    self.llm_client.set_system_prompt(system_prompt)
+                    llm_client.set_system_prompt(self.SYSTEM_PROMPT)
                 
-                response = self.llm_client.ask_llm(user_query)
+                response = llm_client.ask_llm(self._date_context() + user_query)
                 logger.debug(f"LLM response (attempt {attempt}): {response[:500]}...")
             
                 # Try to extract JSON from response (in case there's extra text)
@@ -309,7 +345,7 @@ Today's date: {today} ({day_of_week})
                     logger.error(f"No JSON found in LLM response (attempt {attempt}). Response was: {response}")
                     if attempt < max_retries:
                         logger.warning(f"Retrying... (attempt {attempt + 1})")
-                        self.llm_client.clear_history(keep_system_prompt=True)
+                        llm_client.clear_history(keep_system_prompt=True)
                         continue
                     logger.warning("Falling back to default dates (next 7 days)")
                     return self._default_dates()
@@ -322,7 +358,7 @@ Today's date: {today} ({day_of_week})
                     logger.error(f"JSON error: {e}")
                     if attempt < max_retries:
                         logger.warning(f"Retrying... (attempt {attempt + 1})")
-                        self.llm_client.clear_history(keep_system_prompt=True)
+                        llm_client.clear_history(keep_system_prompt=True)
                         continue
                     logger.warning("Falling back to default dates (next 7 days)")
                     return self._default_dates()
@@ -334,7 +370,7 @@ Today's date: {today} ({day_of_week})
                     logger.warning(f"Missing required fields in response (attempt {attempt}): {missing}. Got: {date_info}")
                     if attempt < max_retries:
                         logger.warning(f"Retrying... (attempt {attempt + 1})")
-                        self.llm_client.clear_history(keep_system_prompt=True)
+                        llm_client.clear_history(keep_system_prompt=True)
                         continue
                     logger.warning("Falling back to default dates (next 7 days)")
                     return self._default_dates()
@@ -365,7 +401,7 @@ Today's date: {today} ({day_of_week})
                 logger.info(f"Determined dates (attempt {attempt}): {date_info['start_date']} to {date_info['end_date']}")
                 
                 # Clear conversation history for next reasoning to avoid contamination
-                self.llm_client.clear_history(keep_system_prompt=True)
+                llm_client.clear_history(keep_system_prompt=True)
                 
                 return date_info
             
@@ -374,7 +410,7 @@ Today's date: {today} ({day_of_week})
                 logger.exception("Full traceback:")
                 if attempt < max_retries:
                     logger.warning(f"Retrying... (attempt {attempt + 1})")
-                    self.llm_client.clear_history(keep_system_prompt=True)
+                    llm_client.clear_history(keep_system_prompt=True)
                     continue
                 logger.warning("Falling back to default dates (next 7 days)")
                 return self._default_dates()
@@ -0,0 +1,53 @@
+"""PulseAudio source listing shared by the system audio Whisper clients."""
+
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+
+
+PACTL_SOURCES_TTL = 1.0  # Seconds one `pactl list sources short` result is shared between callers
+# One `pactl list sources short` row, tab separated: index, name, driver, sample spec, state.
+# The sample spec is always "<format> <N>ch <N>Hz", e.g. "s16le 2ch 48000Hz"
+PACTL_SOURCE_ROW = re.compile(rb"^\d+\t([^\t\n]+)\t[^\t\n]*\t\S+ (\d+)ch (\d+)Hz\t(\w+)", re.M)
+
+_pulse_sources_cache = {"ts": 0.0, "rows": [], "pactl": None}
+_pulse_sources_lock = threading.Lock()
+
+
+def list_pulse_sources() -> list:
+    """
+    Return (name, channels, sample_rate, state) for every PulseAudio source.
+
+    Back-to-back lookups (pick a source, then read its format) share one pactl run,
+    also across clients living in the same process.
+    """
+    with _pulse_sources_lock:
+        now = time.monotonic()
+        if now - _pulse_sources_cache["ts"] < PACTL_SOURCES_TTL:
+            return _pulse_sources_cache["rows"]
+
+        # subprocess only takes the posix_spawn fast path for an executable with a directory
+        # component, so look pactl up on PATH once and run it by absolute path
+        if _pulse_sources_cache["pactl"] is None:
+            _pulse_sources_cache["pactl"] = shutil.which('pactl') or 'pactl'
+
+        # Only stdout gets a pipe. close_fds=False is safe, our fds are non-inheritable by
+        # default so pactl still gets none of them.
+        # C locale skips pactl's locale setup and keeps its output plain ASCII, the rest of
+        # the environment is read per call so PULSE_SOURCE set by the clients still applies
+        result = subprocess.run([_pulse_sources_cache["pactl"], 'list', 'sources', 'short'],
+                                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                close_fds=False, env={**os.environ, "LC_ALL": "C"}, timeout=1)
+
+        # One pass over the whole output instead of splitting and scanning line by line
+        rows = [
+            (name.decode(errors='replace'), int(channels), int(sample_rate), state.decode())
+            for name, channels, sample_rate, state in PACTL_SOURCE_ROW.findall(result.stdout)
+        ]
+
+        _pulse_sources_cache["ts"] = now
+        _pulse_sources_cache["rows"] = rows
+        return rows
@@ -4,7 +4,9 @@ import numpy as np
 import speech_recognition as sr
 import whisper
 import torch
+import subprocess
 import threading
+import time
 import platform
 
 # Suppress ALSA warnings on Linux
@@ -41,6 +43,11 @@ from queue import Queue
 from time import sleep
 from sys import platform as sys_platform
 
+try:
+    from .pulse_sources import list_pulse_sources
+except ImportError:
+    from pulse_sources import list_pulse_sources
+
 
 LOG_PREFIX = "[WHISPER_CLIENT]"
 
@@ -168,31 +175,18 @@ class SystemAudioWhisperClient:
                 raise
 
         elif system == "Linux":
-            import subprocess
-
-            # Get list of all sources and find the first RUNNING one, otherwise IDLE
-            result = subprocess.run(['pactl', 'list', 'sources', 'short'],
-                                capture_output=True, text=True)
-
+            # Find the first RUNNING source, otherwise IDLE
             active_source = None
             idle_source = None
 
-            for line in result.stdout.strip().split('\n'):
-                if not line or line.startswith('#'):
-                    continue
-
-                parts = line.split()
-                if len(parts) >= 5:
-                    source_name = parts[1]
-                    status = parts[4] if len(parts) > 4 else ''
-
-                    # Prioritize RUNNING sources (actively capturing audio)
-                    if 'RUNNING' in status:
-                        active_source = source_name
-                        break
-                    # Keep track of first IDLE source as backup
-                    elif 'IDLE' in status and idle_source is None:
-                        idle_source = source_name
+            for source_name, _channels, _sample_rate, status in list_pulse_sources():
+                # Prioritize RUNNING sources (actively capturing audio)
+                if status == 'RUNNING':
+                    active_source = source_name
+                    break
+                # Keep track of first IDLE source as backup
+                elif status == 'IDLE' and idle_source is None:
+                    idle_source = source_name
 
             # Use running source, or fall back to idle, or use default
             selected_source = active_source or idle_source
@@ -246,26 +240,14 @@ class SystemAudioWhisperClient:
     
     def _update_source_info(self, source_name):
         """Get channel count and sample rate from PulseAudio source"""
-        import subprocess
         try:
-            # Parse from pactl list sources short output (format: s16le 2ch 48000Hz)
-            result = subprocess.run(['pactl', 'list', 'sources', 'short'],
-                                capture_output=True, text=True, timeout=1)
-
-            for line in result.stdout.strip().split('\n'):
-                if source_name in line:
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        # Extract channel count (e.g., "2ch" -> 2)
-                        channels_str = parts[3]
-                        if 'ch' in channels_str:
-                            self.source_channels = int(channels_str.replace('ch', ''))
-
-                        # Extract sample rate (e.g., "48000Hz" -> 48000)
-                        rate_str = parts[4] if len(parts) > 4 else '44100Hz'
-                        if 'Hz' in rate_str:
-                            self.source_sample_rate = int(rate_str.replace('Hz', ''))
-                        break
+            for name, channels, sample_rate, _status in list_pulse_sources():
+                if name == source_name:
+                    if channels:
+                        self.source_channels = channels
+                    if sample_rate:
+                        self.source_sample_rate = sample_rate
+                    break
         except Exception as e:
             _log(f"Could not get source info, using defaults: {e}")
             self.source_channels = 2
@@ -275,9 +257,6 @@ class SystemAudioWhisperClient:
         """Check for RUNNING audio sources and switch if needed (Linux only)"""
         if platform.system() != "Linux":
             return False
-            
-        import subprocess
-        import time
         
         # Only check every 3 seconds to avoid excessive system calls
         current_time = time.time()
@@ -287,36 +266,31 @@ class SystemAudioWhisperClient:
         self.last_source_check = current_time
         
         try:
-            result = subprocess.run(['pactl', 'list', 'sources', 'short'], 
-                                capture_output=True, text=True, timeout=1)
-            
-            for line in result.stdout.strip().split('\n'):
-                if not line or line.startswith('#'):
-                    continue
+            sources = list_pulse_sources()
+            # Stay on the current source while it is still capturing, otherwise two RUNNING
+            # sources would be swapped back and forth on every check
+            if any(name == self.current_source and status == 'RUNNING' for name, _c, _r, status in sources):
+                return False
+
+            for source_name, _channels, _sample_rate, status in sources:
+                # If we find a RUNNING source and it's different from current
+                if status == 'RUNNING' and source_name != self.current_source:
+                    _log(f"Switching to active audio source: {source_name}")
+                    subprocess.run(['pactl', 'set-default-source', source_name])
+                    os.environ['PULSE_SOURCE'] = source_name
+                    self.current_source = source_name
                     
-                parts = line.split()
-                if len(parts) >= 5:
-                    source_name = parts[1]
-                    status = parts[4] if len(parts) > 4 else ''
+                    # Update source info (channels and sample rate)
+                    self._update_source_info(source_name)
                     
-                    # If we find a RUNNING source and it's different from current
-                    if 'RUNNING' in status and source_name != self.current_source:
-                        _log(f"Switching to active audio source: {source_name}")
-                        subprocess.run(['pactl', 'set-default-source', source_name])
-                        os.environ['PULSE_SOURCE'] = source_name
-                        self.current_source = source_name
-                        
-                        # Update source info (channels and sample rate)
-                        self._update_source_info(source_name)
-                        
-                        # Close and reopen stream with new source
-                        if self.stream:
-                            self.stream.stop_stream()
-                            self.stream.close()
-                        
-                        # Reopen with same settings
-                        self._open_audio_stream()
-                        return True
+                    # Close and reopen stream with new source
+                    if self.stream:
+                        self.stream.stop_stream()
+                        self.stream.close()
+                    
+                    # Reopen with same settings
+                    self._open_audio_stream()
+                    return True
         except Exception as e:
             _log(f"Error checking audio sources: {e}")
 
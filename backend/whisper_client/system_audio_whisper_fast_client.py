@@ -5,12 +5,16 @@ import warnings
 os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
+import ctranslate2
 import numpy as np
-import torch
+import subprocess
 import threading
+import time
 import platform
 
 from faster_whisper import WhisperModel
+from faster_whisper.feature_extractor import FeatureExtractor
+from faster_whisper.vad import get_vad_model
 
 # Suppress ALSA warnings on Linux
 from ctypes import *
@@ -41,13 +45,26 @@ def noalsaerr():
 with noalsaerr():
     import pyaudio
 
+from collections import deque
 from datetime import datetime, timedelta
 from queue import Queue
 from time import sleep
 from sys import platform as sys_platform
 
+try:
+    from .pulse_sources import list_pulse_sources
+except ImportError:
+    from pulse_sources import list_pulse_sources
+
 
 LOG_PREFIX = "[WHISPER_FAST_CLIENT]"
+TARGET_SAMPLE_RATE = 16000
+FRAMES_PER_BUFFER = 1024
+VAD_WINDOW_SAMPLES = 512
+VAD_CONTEXT_SAMPLES = 64
+VAD_SPEECH_PAD_MS = 400  # Audio kept before and after detected speech, like faster-whisper's speech_pad_ms
+PROMPT_CONTEXT_CHARS = 200
+INT16_TO_FLOAT = np.float32(1.0 / 32768.0)
 
 
 def _log(message: str) -> None:
@@ -55,6 +72,76 @@ def _log(message: str) -> None:
     print(f"{LOG_PREFIX} {message}")
 
 
+class _IncrementalFeatureExtractor(FeatureExtractor):
+    """
+    FeatureExtractor that reuses log-mel frames across calls on a growing phrase.
+
+    The transcription loop re-transcribes the same phrase buffer every tick with a
+    few more samples appended. STFT frames that lie entirely inside the audio seen
+    so far can't change, so only the new frames and the few frames touching the end
+    padding are recomputed. The final normalization depends on the global maximum and
+    is still applied over the whole spectrogram, so output matches FeatureExtractor.
+    Call reset() when a new phrase starts in the same buffer.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.window = np.hanning(self.n_fft + 1)[:-1].astype("float32")
+        self.reset()
+
+    def reset(self):
+        """Forget cached frames (a new phrase is being written to the buffer)."""
+        self._source = None
+        self._log_mel = np.empty((self.mel_filters.shape[0], 0), dtype=np.float32)
+        self._stable_frames = 0
+
+    def __call__(self, waveform: np.ndarray, padding=160, chunk_length=None):
+        if waveform.dtype != np.float32 or padding != self.hop_length or len(waveform) < self.n_fft:
+            self.reset()
+            return super().__call__(waveform, padding=padding, chunk_length=chunk_length)
+
+        # Cached frames are only valid for the buffer they were computed from
+        source = waveform.base if waveform.base is not None else waveform
+        if source is not self._source or len(waveform) < self._stable_frames * self.hop_length:
+            self.reset()
+            self._source = source
+
+        if chunk_length is not None:
+            self.n_samples = chunk_length * self.sampling_rate
+            self.nb_max_frames = self.n_samples // self.hop_length
+
+        half_window = self.n_fft // 2
+        num_frames = (len(waveform) + padding) // self.hop_length
+        stable_frames = min((len(waveform) - half_window) // self.hop_length + 1, num_frames)
+        first = min(self._stable_frames, num_frames)
+
+        # Same padding as FeatureExtractor: trailing zeros, then centered reflection
+        padded = np.pad(np.pad(waveform, (0, padding)), half_window, mode="reflect")
+        segment = padded[first * self.hop_length:(num_frames - 1) * self.hop_length + self.n_fft]
+        stft = self.stft(
+            segment,
+            self.n_fft,
+            self.hop_length,
+            window=self.window,
+            center=False,
+            return_complex=True,
+        ).astype("complex64")
+        mel_spec = self.mel_filters @ (np.abs(stft) ** 2)
+        new_log_mel = np.log10(np.clip(mel_spec, a_min=1e-10, a_max=None))
+
+        if num_frames > self._log_mel.shape[1]:
+            grown = np.empty((self._log_mel.shape[0], max(num_frames, 2 * self._log_mel.shape[1])), dtype=np.float32)
+            grown[:, :first] = self._log_mel[:, :first]
+            self._log_mel = grown
+        self._log_mel[:, first:num_frames] = new_log_mel
+        self._stable_frames = stable_frames
+
+        log_spec = self._log_mel[:, :num_frames]
+        log_spec = np.maximum(log_spec, log_spec.max() - 8.0)
+        log_spec = (log_spec + 4.0) / 4.0
+
+        return log_spec
+
+
 class SystemAudioWhisperFastClient:
     """
     WhisperClient using Faster Whisper for improved performance.
@@ -74,13 +161,13 @@ class SystemAudioWhisperFastClient:
                  record_timeout=0.1, phrase_timeout=1, on_phrase_complete=None,
                  silence_threshold=0.01, max_phrase_duration=15,
                  # Whisper accuracy parameters
-                 language="en", temperature=0.0, initial_prompt=None,
-                 condition_on_previous_text=True, no_speech_threshold=0.6,
+                 language="en", temperature=(0.0, 0.2, 0.4), initial_prompt=None,
+                 condition_on_previous_text=False, no_speech_threshold=0.6,
                  log_prob_threshold=-1.0, compression_ratio_threshold=2.4,
-                 min_audio_length=0.3,
+                 min_audio_length=0.3, vad_threshold=0.5,
                  # Faster Whisper specific parameters
                  compute_type="float16", device="auto", cpu_threads=4,
-                 num_workers=1):
+                 num_workers=1, download_root=None):
         """
         Initialize the transcription service.
 
@@ -96,13 +183,16 @@ class SystemAudioWhisperFastClient:
 
             # Whisper Accuracy Parameters:
             language: Language code (e.g., "en", "es", "fr"). Explicitly setting improves accuracy
-            temperature: Sampling temperature (0.0 = greedy/deterministic)
-            initial_prompt: Optional text to provide context/vocabulary to the model
+            temperature: Sampling temperature (0.0 = greedy/deterministic). A tuple falls back to the
+                         next temperature when a decode fails the log-prob/compression thresholds
+            initial_prompt: Optional text to provide context/vocabulary to the model. The tail of the
+                            previous phrase is appended to it for continuity
             condition_on_previous_text: Use context from previous segments for better continuity
             no_speech_threshold: Threshold to filter out non-speech/hallucinations (0.0-1.0)
             log_prob_threshold: Filter segments with low average log probability
             compression_ratio_threshold: Detect repetitive/bad transcriptions
             min_audio_length: Minimum audio length in seconds before transcribing
+            vad_threshold: Silero VAD speech probability above which captured audio is kept
 
             # Faster Whisper Specific Parameters:
             compute_type: Quantization type ("float16", "int8_float16", "int8", "float32")
@@ -113,6 +203,7 @@ class SystemAudioWhisperFastClient:
             device: Device to use ("auto", "cuda", "cpu")
             cpu_threads: Number of threads for CPU inference
             num_workers: Number of workers for parallel processing
+            download_root: Directory to download/cache models in (defaults to the Hugging Face cache)
         """
         self.model_name = model
         self.non_english = non_english
@@ -132,18 +223,23 @@ class SystemAudioWhisperFastClient:
         self.log_prob_threshold = log_prob_threshold
         self.compression_ratio_threshold = compression_ratio_threshold
         self.min_audio_length = min_audio_length
+        self.vad_threshold = vad_threshold
 
         # Faster Whisper specific parameters
         self.compute_type = compute_type
         self.device = device
+        if device == "auto":
+            self.device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
         self.cpu_threads = cpu_threads
         self.num_workers = num_workers
+        self.download_root = download_root
 
         # State variables
         self.last_speech_time = None
         self.phrase_start_time = None
         self.data_queue = Queue()
-        self.phrase_bytes = bytes()
+        self.phrase_audio = np.empty(0, dtype=np.float32)
+        self.phrase_samples = 0
         self.transcription = ['']
         self.last_transcription = ''
         self.is_running = False
@@ -155,12 +251,19 @@ class SystemAudioWhisperFastClient:
         self.pyaudio_instance = None
         self.stream = None
         self.audio_model = None
+        self._features = None
         self.device_info = None
         self.current_source = None
         self.source_channels = 2
         self.source_sample_rate = 44100
         self.source_check_thread = None
         self.last_source_check = 0
+        self._process_chunk = None
+
+        # Streaming VAD state, carried across capture chunks
+        self._vad_model = None
+        self._vad_pad_chunks = 0  # VAD_SPEECH_PAD_MS in capture chunks, set once the stream format is known
+        self._reset_vad()
 
     def _get_system_audio_device(self):
         """Get the appropriate system audio device based on OS"""
@@ -196,28 +299,15 @@ class SystemAudioWhisperFastClient:
                 raise
 
         elif system == "Linux":
-            import subprocess
-
-            result = subprocess.run(['pactl', 'list', 'sources', 'short'],
-                                capture_output=True, text=True)
-
             active_source = None
             idle_source = None
 
-            for line in result.stdout.strip().split('\n'):
-                if not line or line.startswith('#'):
-                    continue
-
-                parts = line.split()
-                if len(parts) >= 5:
-                    source_name = parts[1]
-                    status = parts[4] if len(parts) > 4 else ''
-
-                    if 'RUNNING' in status:
-                        active_source = source_name
-                        break
-                    elif 'IDLE' in status and idle_source is None:
-                        idle_source = source_name
+            for source_name, _channels, _sample_rate, status in list_pulse_sources():
+                if status == 'RUNNING':
+                    active_source = source_name
+                    break
+                elif status == 'IDLE' and idle_source is None:
+                    idle_source = source_name
 
             selected_source = active_source or idle_source
 
@@ -253,20 +343,44 @@ class SystemAudioWhisperFastClient:
             raise ValueError(f"Unsupported platform: {system}")
 
     def _initialize_audio(self):
-        """Initialize audio components."""
+        """Initialize audio components, loading the model while the audio device is set up."""
+        model_errors = []
+
+        def load_model():
+            try:
+                self._load_model()
+            except Exception as e:
+                model_errors.append(e)
+
+        model_thread = threading.Thread(target=load_model, daemon=True)
+        model_thread.start()
+
+        try:
+            self._init_audio_device()
+        finally:
+            model_thread.join()
+
+        if model_errors:
+            raise model_errors[0]
+
+    def _init_audio_device(self):
+        """Find and open the system audio device."""
         self.pyaudio_instance, self.device_info = self._get_system_audio_device()
         _log(f"Using audio device: {self.device_info['name']}")
 
+    def _load_model(self):
+        """Load and warm up the Faster Whisper model (kept across start/stop cycles)."""
+        if self.audio_model is not None:
+            return
+
+        self._vad_model = get_vad_model()
+
         # Determine model name
         model = self.model_name
         if self.model_name != "large" and self.model_name != "large-v2" and self.model_name != "large-v3" and not self.non_english:
             model = model + ".en"
 
-        # Determine device
-        if self.device == "auto":
-            device = "cuda" if torch.cuda.is_available() else "cpu"
-        else:
-            device = self.device
+        device = self.device
 
         # Adjust compute type for CPU
         compute_type = self.compute_type
@@ -281,30 +395,38 @@ class SystemAudioWhisperFastClient:
             device=device,
             compute_type=compute_type,
             cpu_threads=self.cpu_threads,
-            num_workers=self.num_workers
+            num_workers=self.num_workers,
+            download_root=self.download_root
         )
 
+        # Reuse log-mel frames across the repeated transcribe calls on one phrase
+        self._features = _IncrementalFeatureExtractor(**self.audio_model.feat_kwargs)
+        self.audio_model.feature_extractor = self._features
+
+        # Decode half a second of silence so the first real phrase doesn't pay for
+        # encoder/kernel initialization
+        segments, _ = self.audio_model.transcribe(
+            np.zeros(TARGET_SAMPLE_RATE // 2, dtype=np.float32),
+            language=self.language,
+            beam_size=1,
+            without_timestamps=True,
+            max_new_tokens=1
+        )
+        for _ in segments:
+            pass
+
         _log("Faster Whisper model loaded")
 
     def _update_source_info(self, source_name):
         """Get channel count and sample rate from PulseAudio source"""
-        import subprocess
         try:
-            result = subprocess.run(['pactl', 'list', 'sources', 'short'],
-                                capture_output=True, text=True, timeout=1)
-
-            for line in result.stdout.strip().split('\n'):
-                if source_name in line:
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        channels_str = parts[3]
-                        if 'ch' in channels_str:
-                            self.source_channels = int(channels_str.replace('ch', ''))
-
-                        rate_str = parts[4] if len(parts) > 4 else '44100Hz'
-                        if 'Hz' in rate_str:
-                            self.source_sample_rate = int(rate_str.replace('Hz', ''))
-                        break
+            for name, channels, sample_rate, _status in list_pulse_sources():
+                if name == source_name:
+                    if channels:
+                        self.source_channels = channels
+                    if sample_rate:
+                        self.source_sample_rate = sample_rate
+                    break
         except Exception as e:
             _log(f"Could not get source info, using defaults: {e}")
             self.source_channels = 2
@@ -315,9 +437,6 @@ class SystemAudioWhisperFastClient:
         if platform.system() != "Linux":
             return False
 
-        import subprocess
-        import time
-
         current_time = time.time()
         if current_time - self.last_source_check < 3:
             return False
@@ -325,98 +444,165 @@ class SystemAudioWhisperFastClient:
         self.last_source_check = current_time
 
         try:
-            result = subprocess.run(['pactl', 'list', 'sources', 'short'],
-                                capture_output=True, text=True, timeout=1)
-
-            for line in result.stdout.strip().split('\n'):
-                if not line or line.startswith('#'):
-                    continue
-
-                parts = line.split()
-                if len(parts) >= 5:
-                    source_name = parts[1]
-                    status = parts[4] if len(parts) > 4 else ''
-
-                    if 'RUNNING' in status and source_name != self.current_source:
-                        _log(f"Switching to active audio source: {source_name}")
-                        subprocess.run(['pactl', 'set-default-source', source_name])
-                        os.environ['PULSE_SOURCE'] = source_name
-                        self.current_source = source_name
-
-                        self._update_source_info(source_name)
-
-                        if self.stream:
-                            self.stream.stop_stream()
-                            self.stream.close()
-
-                        self._open_audio_stream()
-                        return True
+            sources = list_pulse_sources()
+            # Stay on the current source while it is still capturing, otherwise two RUNNING
+            # sources would be swapped back and forth on every check
+            if any(name == self.current_source and status == 'RUNNING' for name, _c, _r, status in sources):
+                return False
+
+            for source_name, _channels, _sample_rate, status in sources:
+                if status == 'RUNNING' and source_name != self.current_source:
+                    _log(f"Switching to active audio source: {source_name}")
+                    subprocess.run(['pactl', 'set-default-source', source_name])
+                    os.environ['PULSE_SOURCE'] = source_name
+                    self.current_source = source_name
+
+                    self._update_source_info(source_name)
+
+                    if self.stream:
+                        self.stream.stop_stream()
+                        self.stream.close()
+
+                    self._open_audio_stream()
+                    return True
         except Exception as e:
             _log(f"Error checking audio sources: {e}")
 
         return False
 
+    def _get_stream_format(self):
+        """Get (channels, sample_rate) for the current device"""
+        if platform.system() == "Linux" and self.device_info["name"] == "pulse":
+            return self.source_channels, self.source_sample_rate
+        return int(self.device_info["maxInputChannels"]), int(self.device_info["defaultSampleRate"])
+
     def _open_audio_stream(self):
         """Open the audio stream with current device settings"""
-        if platform.system() == "Linux" and self.device_info["name"] == "pulse":
-            channels = self.source_channels
-            rate = self.source_sample_rate
-        else:
-            channels = int(self.device_info["maxInputChannels"])
-            rate = int(self.device_info["defaultSampleRate"])
+        channels, rate = self._get_stream_format()
 
         self.stream = self.pyaudio_instance.open(
             format=pyaudio.paInt16,
             channels=channels,
             rate=rate,
             input=True,
-            frames_per_buffer=1024,
+            frames_per_buffer=FRAMES_PER_BUFFER,
             input_device_index=self.device_info["index"]
         )
+        self._process_chunk = self._build_chunk_pipeline(channels, rate, TARGET_SAMPLE_RATE)
+        self._vad_pad_chunks = max(1, round(VAD_SPEECH_PAD_MS * rate / (1000 * FRAMES_PER_BUFFER)))
+        self._reset_vad()
+
+    def _build_chunk_pipeline(self, channels, source_rate, target_rate):
+        """
+        Build the downmix/resample function for a fixed stream format.
+
+        The format only changes when the stream is reopened, so the channel/rate
+        checks and the resampling grid are resolved here once instead of per chunk.
+        Returns a function mapping raw stream bytes to (float32 audio, RMS level).
+        """
+        steps = []
+
+        if channels > 1:
+            def downmix(audio_array):
+                return audio_array.reshape(-1, channels).mean(axis=1).astype(np.int16)
+            steps.append(downmix)
+
+        if source_rate != target_rate:
+            num_samples = int(FRAMES_PER_BUFFER * target_rate / source_rate)
+            sample_points = np.linspace(0, FRAMES_PER_BUFFER, num_samples)
+            source_points = np.arange(FRAMES_PER_BUFFER)
+
+            def resample(audio_array):
+                return np.interp(sample_points, source_points, audio_array).astype(np.int16)
+            steps.append(resample)
+
+        def process_chunk(data):
+            audio_array = np.frombuffer(data, dtype=np.int16)
+            for step in steps:
+                audio_array = step(audio_array)
+
+            audio_float = audio_array * INT16_TO_FLOAT
+            audio_level = np.sqrt(np.mean(audio_float**2))
+            return audio_float, audio_level
+
+        return process_chunk
+
+    def _reset_vad(self):
+        """Reset the streaming VAD (LSTM state, window context, pending samples and speech padding)."""
+        self._vad_h = np.zeros((1, 1, 128), dtype=np.float32)
+        self._vad_c = np.zeros((1, 1, 128), dtype=np.float32)
+        self._vad_context = np.zeros(VAD_CONTEXT_SAMPLES, dtype=np.float32)
+        self._vad_pending = np.empty(0, dtype=np.float32)
+        self._vad_is_speech = False
+        self._vad_preroll = deque(maxlen=self._vad_pad_chunks)  # Latest non-speech chunks, not queued yet
+        self._vad_hangover = 0  # Chunks still to queue after speech stopped
+
+    def _detect_speech(self, audio_float):
+        """
+        Run Silero VAD over newly captured 16 kHz audio, carrying its state across chunks.
+
+        The model only scores whole 512-sample windows, so leftover samples wait for the
+        next chunk and a chunk that completes no window reuses the previous decision.
+        """
+        audio = np.concatenate((self._vad_pending, audio_float))
+        num_windows = len(audio) // VAD_WINDOW_SAMPLES
+
+        if num_windows:
+            windows = audio[:num_windows * VAD_WINDOW_SAMPLES].reshape(num_windows, VAD_WINDOW_SAMPLES)
+
+            # Each window is prefixed with the tail of the window before it, as Silero expects
+            contexts = np.concatenate((self._vad_context[np.newaxis], windows[:-1, -VAD_CONTEXT_SAMPLES:]))
+            speech_probs, self._vad_h, self._vad_c = self._vad_model.session.run(
+                None,
+                {"input": np.concatenate((contexts, windows), axis=1), "h": self._vad_h, "c": self._vad_c}
+            )
+
+            self._vad_context = windows[-1, -VAD_CONTEXT_SAMPLES:].copy()
+            self._vad_is_speech = bool(speech_probs.max() >= self.vad_threshold)
+
+        self._vad_pending = audio[num_windows * VAD_WINDOW_SAMPLES:]
+        return self._vad_is_speech
 
     def _audio_capture_loop(self):
         """Capture audio from active audio source and put into queue."""
         try:
-            target_rate = 16000
-
             self._open_audio_stream()
 
             while self.is_running:
                 self._check_and_switch_source()
 
-                if platform.system() == "Linux" and self.device_info["name"] == "pulse":
-                    channels = self.source_channels
-                    source_rate = self.source_sample_rate
-                else:
-                    channels = int(self.device_info["maxInputChannels"])
-                    source_rate = int(self.device_info["defaultSampleRate"])
-
                 if not self.is_paused:
-                    data = self.stream.read(1024, exception_on_overflow=False)
-
-                    audio_array = np.frombuffer(data, dtype=np.int16)
-
-                    if channels > 1:
-                        audio_array = audio_array.reshape(-1, channels)
-                        audio_array = audio_array.mean(axis=1).astype(np.int16)
-
-                    if source_rate != target_rate:
-                        num_samples = int(len(audio_array) * target_rate / source_rate)
-                        audio_array = np.interp(
-                            np.linspace(0, len(audio_array), num_samples),
-                            np.arange(len(audio_array)),
-                            audio_array
-                        ).astype(np.int16)
-
-                    audio_float = audio_array.astype(np.float32) / 32768.0
-                    audio_level = np.sqrt(np.mean(audio_float**2))
-
-                    self.data_queue.put({
-                        'data': audio_array.tobytes(),
-                        'level': audio_level,
-                        'timestamp': datetime.now(tz=None)
-                    })
+                    data = self.stream.read(FRAMES_PER_BUFFER, exception_on_overflow=False)
+                    audio_float, audio_level = self._process_chunk(data)
+
+                    # Only speech, padded on both sides, reaches the transcription thread,
+                    # so Whisper's own VAD pass over the whole phrase isn't needed
+                    if self._detect_speech(audio_float):
+                        if self._vad_preroll:
+                            # The VAD fires a little into the first word, so lead in with the audio before it
+                            audio_float = np.concatenate((*self._vad_preroll, audio_float))
+                            self._vad_preroll.clear()
+                        self._vad_hangover = self._vad_pad_chunks
+                        self.data_queue.put({
+                            'data': audio_float,
+                            'level': audio_level,
+                            'timestamp': datetime.now(tz=None),
+                            'hangover': False
+                        })
+                    elif self._vad_hangover:
+                        # Keep the trailing sounds of the last word before closing the phrase
+                        self._vad_hangover -= 1
+                        self.data_queue.put({
+                            'data': audio_float,
+                            'level': audio_level,
+                            'timestamp': datetime.now(tz=None),
+                            'hangover': True
+                        })
+                    else:
+                        self._vad_preroll.append(audio_float)
                 else:
+                    # Paused audio is discarded, so start the VAD fresh on resume
+                    self._reset_vad()
                     sleep(0.1)
 
         except Exception as e:
@@ -445,37 +631,35 @@ class SystemAudioWhisperFastClient:
                             has_speech = True
                             self.last_speech_time = chunk['timestamp']
                             chunks.append(chunk['data'])
+                        elif chunk['hangover'] and (chunks or self.phrase_samples):
+                            # Quiet padding after speech belongs to the open phrase, but is not speech itself
+                            chunks.append(chunk['data'])
 
                         latest_timestamp = chunk['timestamp']
 
                     if chunks:
-                        audio_data = b''.join(chunks)
-
-                        if not self.phrase_bytes:
+                        if not self.phrase_samples:
                             self.phrase_start_time = now
+                            self._features.reset()
 
-                        self.phrase_bytes += audio_data
+                        self._append_phrase_audio(chunks)
 
-                    if self.phrase_bytes:
-                        audio_np = np.frombuffer(self.phrase_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+                    if self.phrase_samples:
+                        audio_np = self.phrase_audio[:self.phrase_samples]
 
-                        min_samples = int(self.min_audio_length * 16000)
+                        min_samples = int(self.min_audio_length * TARGET_SAMPLE_RATE)
                         if len(audio_np) > min_samples:
                             # Faster Whisper transcription - returns segments iterator
                             segments, info = self.audio_model.transcribe(
                                 audio_np,
                                 language=self.language,
                                 temperature=self.temperature,
-                                initial_prompt=self.initial_prompt,
+                                initial_prompt=self._build_prompt(),
                                 condition_on_previous_text=self.condition_on_previous_text,
                                 no_speech_threshold=self.no_speech_threshold,
                                 log_prob_threshold=self.log_prob_threshold,
                                 compression_ratio_threshold=self.compression_ratio_threshold,
-                                vad_filter=True,  # Enable VAD for better accuracy
-                                vad_parameters=dict(
-                                    min_silence_duration_ms=500,
-                                    speech_pad_ms=400
-                                )
+                                vad_filter=False  # Already applied per chunk in _audio_capture_loop
                             )
 
                             # Collect all segment texts
@@ -499,7 +683,7 @@ class SystemAudioWhisperFastClient:
                                     if text and self.on_phrase_complete:
                                         self.on_phrase_complete(text)
 
-                                    self.phrase_bytes = bytes()
+                                    self.phrase_samples = 0
                                     self.last_speech_time = None
                                     self.phrase_start_time = None
                                     self.last_transcription = ''
@@ -514,12 +698,12 @@ class SystemAudioWhisperFastClient:
                                     if text and self.on_phrase_complete:
                                         self.on_phrase_complete(text)
 
-                                    self.phrase_bytes = bytes()
+                                    self.phrase_samples = 0
                                     self.last_speech_time = None
                                     self.phrase_start_time = None
                                     self.last_transcription = ''
                 else:
-                    if self.last_speech_time and self.phrase_bytes:
+                    if self.last_speech_time and self.phrase_samples:
                         silence_duration = (now - self.last_speech_time).total_seconds()
                         if silence_duration >= self.phrase_timeout:
                             text = self.transcription[-1]
@@ -528,7 +712,7 @@ class SystemAudioWhisperFastClient:
                             if text and self.on_phrase_complete:
                                 self.on_phrase_complete(text)
 
-                            self.phrase_bytes = bytes()
+                            self.phrase_samples = 0
                             self.last_speech_time = None
                             self.phrase_start_time = None
                             self.last_transcription = ''
@@ -540,6 +724,29 @@ class SystemAudioWhisperFastClient:
                     _log(f"Error in transcription loop: {e}")
                 break
 
+    def _append_phrase_audio(self, chunks):
+        """
+        Copy newly captured float32 chunks into the phrase buffer.
+
+        Samples are converted from int16 once, on the capture side. The buffer is
+        preallocated for max_phrase_duration and grows by doubling if a phrase runs over.
+        """
+        end = self.phrase_samples + sum(len(chunk) for chunk in chunks)
+
+        if end > len(self.phrase_audio):
+            grown = np.empty(max(end, 2 * len(self.phrase_audio)), dtype=np.float32)
+            grown[:self.phrase_samples] = self.phrase_audio[:self.phrase_samples]
+            self.phrase_audio = grown
+
+        for chunk in chunks:
+            self.phrase_audio[self.phrase_samples:self.phrase_samples + len(chunk)] = chunk
+            self.phrase_samples += len(chunk)
+
+    def _build_prompt(self):
+        """Initial prompt plus the tail of the last completed phrase, as short rolling context."""
+        previous = self.transcription[-2][-PROMPT_CONTEXT_CHARS:] if len(self.transcription) > 1 else ''
+        return ' '.join(part for part in (self.initial_prompt, previous) if part) or None
+
     def _display_transcription(self):
         """Display current transcription (no-op to avoid console clearing)."""
         pass
@@ -549,7 +756,7 @@ class SystemAudioWhisperFastClient:
         self.is_paused = True
         while not self.data_queue.empty():
             self.data_queue.get()
-        self.phrase_bytes = bytes()
+        self.phrase_samples = 0
         self.last_speech_time = None
         self.phrase_start_time = None
         _log("Transcription paused")
@@ -558,7 +765,7 @@ class SystemAudioWhisperFastClient:
         """Resume transcription"""
         self.is_paused = False
         self.last_transcription = ''
-        self.phrase_bytes = bytes()
+        self.phrase_samples = 0
         self.last_speech_time = None
         self.phrase_start_time = None
         while not self.data_queue.empty():
@@ -578,7 +785,8 @@ class SystemAudioWhisperFastClient:
         self.last_speech_time = None
         self.phrase_start_time = None
         self.data_queue = Queue()
-        self.phrase_bytes = bytes()
+        self.phrase_audio = np.empty(int((self.max_phrase_duration + 1) * TARGET_SAMPLE_RATE), dtype=np.float32)
+        self.phrase_samples = 0
         self.transcription = ['']
         self.last_transcription = ''
         self.is_running = True
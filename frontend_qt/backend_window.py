@@ -0,0 +1,341 @@
+"""
+Shared main window for the Thoth and Odin frontends: owns the backend process,
+its health check and the Start/Stop button.
+"""
+
+import logging
+import sys
+from functools import lru_cache
+from pathlib import Path
+from PyQt6.QtWidgets import QWidget, QPushButton
+from PyQt6.QtCore import Qt, QTimer, QElapsedTimer, QProcess, QProcessEnvironment, QUrl
+from PyQt6.QtGui import QPixmap, QFont
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+
+logger = logging.getLogger("frontend_qt.backend")
+
+HEALTH_CHECK_MIN_DELAY = 50  # ms, first probe goes out almost right away
+HEALTH_CHECK_MAX_DELAY = 1000  # ms
+HEALTH_CHECK_BACKOFF = 1.5  # delay multiplier after every failed probe
+HEALTH_CHECK_REQUEST_TIMEOUT = 500  # ms
+BACKEND_URL = "http://127.0.0.1:5000"  # Flask listens on IPv4 loopback, no "localhost" lookup or ::1 attempt
+BACKEND_HEALTH_URL = BACKEND_URL + "/health"
+BACKEND_STOP_TIMEOUT = 3000  # ms to exit after terminate() before it gets killed (POSIX only)
+BACKEND_READY_MARKER = "Server running on"  # printed by the backend right before it starts serving
+
+# Start button colours, keyed on its "state" property. Append to the application style sheet.
+BUTTON_STATE_STYLE = """
+    QPushButton[state="starting"], QPushButton[state="stopping"] {
+        background-color: #6c757d;
+    }
+    QPushButton[state="running"] {
+        background-color: #dc3545;
+    }
+    QPushButton[state="failed"] {
+        background-color: #ffc107;
+    }
+"""
+
+################################################################################
+# SHARED RESOURCES
+################################################################################
+# Built on first use, they need a QApplication to exist
+_BANNER_PIXMAP = None
+_TITLE_FONT = None
+_SECTION_FONT = None
+
+def get_banner() -> QPixmap:
+    global _BANNER_PIXMAP
+    if _BANNER_PIXMAP is None:
+        image_path = Path(__file__).parent / "hahs_logo.png"
+        _BANNER_PIXMAP = QPixmap(str(image_path)).scaled(
+            300, 75, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+        )
+    return _BANNER_PIXMAP
+
+def get_title_font() -> QFont:
+    global _TITLE_FONT
+    if _TITLE_FONT is None:
+        _TITLE_FONT = QFont("Arial", 18, QFont.Weight.Bold)
+    return _TITLE_FONT
+
+def get_section_font() -> QFont:
+    global _SECTION_FONT
+    if _SECTION_FONT is None:
+        _SECTION_FONT = QFont("Arial", 16, QFont.Weight.Bold)
+    return _SECTION_FONT
+
+def set_button_state(button: QPushButton, state: str) -> None:
+    """Set the button's "state" property, re-polishing so [state=...] style sheet rules apply"""
+    if button.property("state") != state:
+        button.setProperty("state", state)
+        button.style().unpolish(button)
+        button.style().polish(button)
+
+def _set_unix_process_parameters(process: QProcess) -> None:
+    """Spawn the backend in its own session with only stdio inherited (Qt 6.7+ on Unix, no-op elsewhere)"""
+    if sys.platform == "win32" or not hasattr(QProcess, "UnixProcessParameters"):
+        return
+    flags = QProcess.UnixProcessFlag
+    if not hasattr(flags, "CreateNewSession"):
+        return
+    # Own session: Ctrl+C in the launching terminal doesn't reach the backend, we stop it ourselves.
+    # PyQt exposes UnixProcessFlag as a plain enum, so combine the values by hand
+    process.setUnixProcessParameters(flags(flags.CloseFileDescriptors.value | flags.CreateNewSession.value))
+
+
+@lru_cache(maxsize=None)
+def resolve_backend_paths(backend_script: Path) -> tuple[str, str, str]:
+    """
+    Returns (python_exe, script_path, working_dir) for a backend script relative to the
+    project root, already as strings for QProcess. These never change, so resolve once.
+    """
+    project_root = Path(__file__).resolve().parent.parent  # frontend_qt -> Thoth
+    script_path = project_root / backend_script
+    if sys.platform == "win32":
+        python_exe = project_root / ".venv" / "Scripts" / "python.exe"
+    else:
+        python_exe = project_root / ".venv" / "bin" / "python"
+    return str(python_exe), str(script_path), str(script_path.parent)
+
+################################################################################
+# BACKEND WINDOW
+################################################################################
+
+class BackendWindow(QWidget):
+    """
+    Base for the frontends' MainWindow. Subclasses set BACKEND_SCRIPT and create
+    self.button (connected to on_button_click) and self.status in their UI setup.
+    """
+    BACKEND_SCRIPT: Path = None  # Relative to the project root
+
+    def __init__(self):
+        super().__init__()
+        # State variables
+        self.is_backend_on = False
+        self.process: QProcess | None = None
+        self.stop_reason = None  # Why the backend is being stopped: None, "user" or "timeout"
+
+        # Backend script and the venv python that runs it, run from the script's directory
+        self._python_exe, self._script_path, self._script_cwd = resolve_backend_paths(self.BACKEND_SCRIPT)
+        self._backend_environment = QProcessEnvironment.systemEnvironment()
+        self._backend_environment.insert("PYTHONUNBUFFERED", "1")
+        self.health_check_elapsed = QElapsedTimer()  # Monotonic stopwatch for the startup log
+        self.health_check_timeout = 15000  # ms
+        self.health_check_delay = HEALTH_CHECK_MIN_DELAY
+        self.health_reply = None
+
+        # Health probes run asynchronously on Qt's event loop so the UI never blocks on them.
+        # The manager keeps the connection to localhost:5000 alive between probes.
+        self.network = QNetworkAccessManager(self)
+
+        # Health probes back off exponentially, so re-arm a single-shot timer after each one
+        self.health_check_timer = QTimer(self)
+        self.health_check_timer.setSingleShot(True)
+        self.health_check_timer.setTimerType(Qt.TimerType.CoarseTimer)  # ~5% slack lets Qt batch wakeups
+        self.health_check_timer.timeout.connect(self._check_backend_health)
+
+        # Gives up on a backend that never answers, independent of how the probes are spaced
+        self.startup_timer = QTimer(self)
+        self.startup_timer.setSingleShot(True)
+        self.startup_timer.timeout.connect(self._on_startup_timeout)
+
+        # Kills the backend if it ignores SIGTERM, cancelled as soon as it exits. Only armed on
+        # POSIX: Windows has no graceful stop for a console backend, it is killed straight away
+        self.kill_timer = QTimer(self)
+        self.kill_timer.setSingleShot(True)
+        self.kill_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.kill_timer.timeout.connect(self._force_kill_if_alive)
+        self.backend_killed = False
+
+    ###############################################################################
+    # SIGNAL CALL BACKS
+    ###############################################################################
+    def on_button_click(self) -> None:
+        """
+        Called when main start button clicked
+        """
+        logger.debug("Button clicked")
+
+        if not self.is_backend_on:
+            # UI Changes, set it to starting... Let the functions inside _start_backend() change
+            # the button to either STOP or START (FAILED)
+            self._set_button_state("starting", "Starting...", enabled=False)
+
+            # Logic
+            self._start_backend()
+        else:
+            # UI Changes, _on_backend_finished() sets it back to START once the backend is gone
+            self._set_button_state("stopping", "Stopping...", enabled=False)
+
+            # Logic
+            self._stop_backend()
+            self.is_backend_on = False
+
+    ###############################################################################
+    # ACTION FUNCTIONS
+    ###############################################################################
+    def _start_backend(self):
+        logger.info("Starting: %s %s", self._python_exe, self._script_path)
+
+        # Start the startup timeout, health polling waits for QProcess.started
+        self.health_check_elapsed.start()
+        self.health_check_delay = HEALTH_CHECK_MIN_DELAY
+        self.startup_timer.start(self.health_check_timeout)
+
+        # Start the process (non-blocking). Unbuffered so the ready line arrives as soon as it is printed
+        self.stop_reason = None
+        self.backend_killed = False
+
+        self.process = QProcess(self)
+        self.process.setProgram(self._python_exe)
+        self.process.setArguments([self._script_path])
+        self.process.setWorkingDirectory(self._script_cwd)
+        self.process.setProcessEnvironment(self._backend_environment)
+        self.process.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedErrorChannel)
+        self.process.started.connect(self._on_backend_started)
+        self.process.readyReadStandardOutput.connect(self._on_backend_output)
+        self.process.finished.connect(self._on_backend_finished)
+        self.process.errorOccurred.connect(self._on_backend_error)
+        self.process.setStandardInputFile(QProcess.nullDevice())  # Backend never reads stdin, don't hold a pipe open for it
+        _set_unix_process_parameters(self.process)
+        self.process.start()
+
+    def _check_backend_health(self):
+        """Poll the backend health endpoint until it responds, startup_timer handles the timeout"""
+        # Ping the health endpoint, the answer arrives in _on_health_reply().
+        # Only the status code matters, so HEAD skips the body (Flask answers HEAD on GET routes)
+        request = QNetworkRequest(QUrl(BACKEND_HEALTH_URL))
+        request.setTransferTimeout(HEALTH_CHECK_REQUEST_TIMEOUT)
+        self.health_reply = self.network.head(request)
+        self.health_reply.finished.connect(lambda reply=self.health_reply: self._on_health_reply(reply))
+
+    def _on_health_reply(self, reply: QNetworkReply):
+        reply.deleteLater()
+        if reply is not self.health_reply:
+            # Health check was aborted while this probe was in flight
+            return
+        self.health_reply = None
+
+        status_code = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        if reply.error() == QNetworkReply.NetworkError.NoError and status_code == 200:
+            logger.info("Backend started successfully in %.2fs", self.health_check_elapsed.elapsed() / 1000)
+            self.startup_timer.stop()
+
+            # Update state and UI to running
+            self.is_backend_on = True
+            self._set_button_state("running", "Stop")
+            self.status.setText("Status: Application is running!")
+            return
+
+        if reply.error() not in (QNetworkReply.NetworkError.ConnectionRefusedError,
+                                 QNetworkReply.NetworkError.OperationCanceledError):
+            # Refused or timed out just means the backend is not ready yet, keep polling
+            logger.warning("Error checking health: %s", reply.errorString())
+
+        self.health_check_delay = min(int(self.health_check_delay * HEALTH_CHECK_BACKOFF), HEALTH_CHECK_MAX_DELAY)
+        self.health_check_timer.start(self.health_check_delay)
+
+    def _on_startup_timeout(self):
+        logger.warning("Backend startup timeout!")
+
+        # Clean up the process, _on_backend_finished() shows the failure once it is gone
+        self._terminate_backend("timeout")
+
+    def _abort_health_check(self):
+        """Stop polling and drop any probe still in flight"""
+        self.health_check_timer.stop()
+        self.startup_timer.stop()
+        if self.health_reply is not None:
+            reply, self.health_reply = self.health_reply, None
+            reply.abort()
+
+    def _on_backend_started(self):
+        # No point probing before the interpreter exists, FailedToStart goes to _on_backend_error instead
+        if self.startup_timer.isActive():  # Not already stopped or timed out
+            self.health_check_timer.start(self.health_check_delay)
+
+    def _on_backend_output(self):
+        """Forward the backend's output, and probe health right away once it says it is serving"""
+        output = bytes(self.process.readAllStandardOutput()).decode(errors="replace")
+        sys.stdout.write(output)
+        sys.stdout.flush()
+
+        if not self.is_backend_on and BACKEND_READY_MARKER in output and self.health_check_timer.isActive():
+            self.health_check_delay = HEALTH_CHECK_MIN_DELAY
+            self.health_check_timer.start(0)
+
+    def _on_backend_error(self, error: QProcess.ProcessError):
+        # Every other error is followed by finished, which does the clean up
+        if error != QProcess.ProcessError.FailedToStart:
+            return
+
+        logger.error("Backend failed to start: %s", self.process.errorString())
+        self._abort_health_check()
+        self.process.deleteLater()
+        self.process = None
+        self._show_start_failed("Status: Backend failed to start")
+
+    def _on_backend_finished(self, exit_code: int, exit_status: QProcess.ExitStatus):
+        """The backend exited, either because _terminate_backend() asked it to or on its own"""
+        self.kill_timer.stop()
+        self._abort_health_check()
+        self.network.clearConnectionCache()  # Pooled sockets point at the dead server
+        self.process.deleteLater()
+        self.process = None
+        self.is_backend_on = False
+
+        if self.stop_reason is None:
+            logger.error("Backend exited unexpectedly (code %d)", exit_code)
+            self._show_start_failed("Status: Backend stopped unexpectedly")
+            return
+
+        if self.backend_killed:
+            logger.warning("Backend force stopped")
+        else:
+            logger.info("Backend stopped gracefully")
+
+        if self.stop_reason == "timeout":
+            self._show_start_failed("Status: Backend failed to start")
+        else:
+            self.status.setText("Status: Stopped")
+            self._reset_button()
+
+    def _stop_backend(self):
+        """Ask the backend to exit, without blocking the UI while it shuts down"""
+        if self.process is not None:
+            logger.info("Stopping backend...")
+            self.status.setText("Status: Stopping...")
+            self._terminate_backend("user")
+
+    def _terminate_backend(self, reason: str):
+        self.stop_reason = reason
+        self._abort_health_check()
+        if sys.platform == "win32":
+            # terminate() only posts WM_CLOSE, which a console Python backend never handles
+            self.backend_killed = True
+            self.process.kill()
+            return
+        self.process.terminate()
+        self.kill_timer.start(BACKEND_STOP_TIMEOUT)
+
+    def _force_kill_if_alive(self):
+        """kill_timer ran out: the backend ignored SIGTERM"""
+        if self.process is not None and self.process.state() != QProcess.ProcessState.NotRunning:
+            logger.warning("Force killing backend...")
+            self.backend_killed = True
+            self.process.kill()
+
+    def _show_start_failed(self, status_text: str):
+        self.is_backend_on = False
+        self._set_button_state("failed", "Start (Failed)")
+        self.status.setText(status_text)
+
+    def _reset_button(self):
+        self._set_button_state("idle", "Start")
+
+    def _set_button_state(self, state: str, text: str, enabled: bool = True):
+        """Switch the start button between idle/starting/running/stopping/failed"""
+        self.button.setText(text)
+        self.button.setEnabled(enabled)
+        set_button_state(self.button, state)
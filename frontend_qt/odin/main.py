@@ -2,23 +2,190 @@
 Simplest PyQt App - Text and a Button
 """
 
+import json
+import logging
+import os
+import re
 import sys
-import subprocess
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication, QCheckBox, QWidget, QVBoxLayout, QHBoxLayout, \
     QPushButton, QLabel, QFrame, QLineEdit, QTimeEdit, QListWidget, QListWidgetItem, QDoubleSpinBox, QSizePolicy
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPixmap, QFont
+from PyQt6.QtCore import Qt, QTimer, QObject, QUrl, pyqtSignal
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
-import requests
-import time
 sys.path.insert(0, str(Path(__file__).parent.parent))
 import utils
+from backend_window import BackendWindow, BACKEND_URL, BUTTON_STATE_STYLE, get_banner, get_section_font, get_title_font, set_button_state
+
+logger = logging.getLogger("odin.frontend_qt")
+
+# Basic dark styling, applied once on the QApplication so every widget inherits it
+##ffffff; Black
+##282c34; Greyish black
+##2c041c; Wine purple
+_QSS = """
+    QWidget {
+        background-color: #2c041c; 
+        color: white;
+        font-size: 16px;
+    }
+    QPushButton {
+        background-color: #28a745;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    QPushButton#callButton {
+        background-color: #0018f9;
+    }
+    QPushButton#callButton[state="running"] {
+        background-color: #dc3545;
+    }
+    QPushButton#moveUpButton, QPushButton#moveDownButton {
+        background-color: #e8e9e8;
+        color: black;
+    }
+    QPushButton#deleteButton {
+        background-color: #ff2400;
+    }
+    QPushButton#retryButton, QPushButton#retryAllButton {
+        background-color: #ffc107;
+        color: black;
+    }
+    QPushButton#clearButton {
+        background-color: #dc3545;
+    }
+    QLineEdit[invalid="true"] {
+        border: 1px solid #dc3545;
+    }
+""" + BUTTON_STATE_STYLE
+
+LIST_SAVE_DELAY = 1000  # ms after the last change before a call list is written to disk
+PHONE_NUMBER_PATTERN = re.compile(r"\+?\d{7,15}")  # Optional +, then 7 to 15 digits
+PHONE_NUMBER_SEPARATORS = re.compile(r"[\s()-]")  # Allowed while typing, dropped before queueing
+
+
+def load_list_file(path: str) -> list[str]:
+    """Read a saved list in one go, skipping blank lines. Missing file means an empty list"""
+    try:
+        lines = Path(path).read_text().splitlines()
+    except FileNotFoundError:
+        return []
+    return [line.strip() for line in lines if line.strip()]
+
+def save_list_file(list_widget: QListWidget, path: str) -> None:
+    """Write the list's items one per line, through a temp file so a crash never leaves half a list"""
+    lines = [list_widget.item(i).text() + "\n" for i in range(list_widget.count())]
+    tmp_path = Path(path + ".tmp")
+    tmp_path.write_text("".join(lines))  # One write for the whole list
+    os.replace(tmp_path, path)
+
+def make_save_timer(parent: QObject, list_widget: QListWidget, save) -> QTimer:
+    """Single-shot timer that runs save() once the list has stopped changing for LIST_SAVE_DELAY"""
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(LIST_SAVE_DELAY)
+    timer.timeout.connect(save)
+    model = list_widget.model()
+    for signal in (model.rowsInserted, model.rowsRemoved, model.modelReset):
+        signal.connect(lambda *_: timer.start())
+    return timer
+
+
+class BackendClient(QObject):
+    """
+    JSON calls to the backend on QNetworkAccessManager, so the GUI keeps running while a request is out.
+    callback(status_code, data) runs once the reply arrives, status_code is None if the backend
+    could not be reached.
+    """
+    def __init__(self, parent: QObject = None):
+        super().__init__(parent)
+        self.network = QNetworkAccessManager(self)
+
+    def post(self, path: str, payload: dict, callback=None, timeout: int = 5000) -> None:
+        request = QNetworkRequest(QUrl(BACKEND_URL + path))
+        request.setTransferTimeout(timeout)
+        request.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/json")
+        self._watch(self.network.post(request, json.dumps(payload).encode()), callback)
+
+    def _watch(self, reply: QNetworkReply, callback) -> None:
+        reply.finished.connect(lambda: self._on_reply(reply, callback))
+
+    def _on_reply(self, reply: QNetworkReply, callback) -> None:
+        reply.deleteLater()
+        status_code = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        try:
+            data = json.loads(bytes(reply.readAll()) or b"{}")
+        except ValueError:
+            data = {}
+        if callback is not None:
+            callback(status_code, data)
+
+
+class SessionWatcher(QObject):
+    """
+    Long-polls the backend's /wait endpoint for one call session and emits
+    session_ended once the backend drops it. Runs on QNetworkAccessManager so the GUI never blocks.
+    """
+    session_ended = pyqtSignal(str, object)  # session_id, call result dict (or None)
+
+    WAIT_TIMEOUT = 25  # s, how long the backend holds each request
+    RETRY_DELAY = 2000  # ms before asking again after a failed request
+
+    def __init__(self, network: QNetworkAccessManager, parent: QObject = None):
+        super().__init__(parent)
+        self.session_id: str = None
+        self.reply: QNetworkReply = None
+        self.network = network
+
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self.retry_timer.timeout.connect(self._send_wait)
+
+    def watch(self, session_id: str) -> None:
+        self.cancel()
+        self.session_id = session_id
+        self._send_wait()
+
+    def cancel(self) -> None:
+        self.session_id = None
+        self.retry_timer.stop()
+        if self.reply is not None:
+            reply, self.reply = self.reply, None
+            reply.abort()
+
+    def _send_wait(self) -> None:
+        url = QUrl(f"{BACKEND_URL}/wait/{self.session_id}")
+        url.setQuery(f"timeout={self.WAIT_TIMEOUT}")
+        request = QNetworkRequest(url)
+        request.setTransferTimeout((self.WAIT_TIMEOUT + 5) * 1000)
+        self.reply = self.network.get(request)
+        self.reply.finished.connect(lambda reply=self.reply: self._on_wait_reply(reply))
+
+    def _on_wait_reply(self, reply: QNetworkReply) -> None:
+        reply.deleteLater()
+        if reply is not self.reply:
+            return  # Cancelled while in flight
+        self.reply = None
 
+        try:
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                raise ValueError(reply.errorString())
+            data = json.loads(bytes(reply.readAll()))
+        except ValueError as e:
+            # Backend busy or restarting, ask again shortly
+            logger.debug("Waiting on session %s failed: %s", self.session_id, e)
+            self.retry_timer.start(self.RETRY_DELAY)
+            return
 
-class AutoDialControl(QWidget):
+        if data.get("ended"):
+            session_id, self.session_id = self.session_id, None
+            self.session_ended.emit(session_id, data.get("result"))
+        else:
+            self._send_wait()  # Held for the full timeout, wait again
 
-    SESSION_POLL_FREQ = 2000  # ms
+
+class AutoDialControl(QWidget):
 
     def __init__(self, phone_list: 'PhoneList' = None, failed_list: 'FailedCallsList' = None):
         super().__init__()
@@ -26,25 +193,33 @@ class AutoDialControl(QWidget):
         self.is_auto_dialing: bool = False
         self.current_session_id: str = None
         self.current_phone_number: str = None
+        self.dial_attempt: int = 0  # Bumped per /start, so a late reply from before a stop is recognised
 
         # References
         self.phone_list = phone_list
         self.failed_list = failed_list
 
-        # Timer to poll backend and check if current call has finished
-        self.poll_timer = QTimer()
-        self.poll_timer.timeout.connect(self._check_call_finished)
+        # Backend calls, and what tells us when the current call has finished
+        self.backend = BackendClient(self)
+        self.session_watcher = SessionWatcher(self.backend.network, self)
+        self.session_watcher.session_ended.connect(self._on_session_ended)
+
+        # Waits out the delay between calls, stopped if the user stops auto-dial in the meantime
+        self.next_call_timer = QTimer(self)
+        self.next_call_timer.setSingleShot(True)
+        self.next_call_timer.timeout.connect(self._dial_next_number)
 
         layout = QVBoxLayout(self)
         self.start_stop_button_layout = QHBoxLayout()
 
         # Auto-Dial and status label
         title_label = QLabel("Auto-Dial")
-        title_label.setFont(QFont("Arial", 16, 700))
+        title_label.setFont(get_section_font())
         self.status_label = QLabel("Status: Stopped")
 
         # AD Start button
         self.start_button = QPushButton("Start")
+        self.start_button.setProperty("state", "idle")
         self.start_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
         self.start_stop_button_layout.addWidget(self.start_button)
         self.start_button.pressed.connect(self._on_auto_dial_start_button_pressed)
@@ -67,33 +242,35 @@ class AutoDialControl(QWidget):
         self.is_auto_dialing = not self.is_auto_dialing
 
         if self.is_auto_dialing:
-            print("[AUTO-DIAL] Started")
+            logger.info("[AUTO-DIAL] Started")
             self.start_button.setText("Stop")
-            self.start_button.setStyleSheet("background-color: #dc3545; padding: 10px; border-radius: 5px;")
+            set_button_state(self.start_button, "running")
             # Kick off the first call immediately
             self._dial_next_number()
         else:
-            print("[AUTO-DIAL] Stopped")
-            self.poll_timer.stop()
+            logger.info("[AUTO-DIAL] Stopped")
+            self.next_call_timer.stop()
+            self.session_watcher.cancel()
             # If there's an active call, stop it
             if self.current_session_id:
                 self._stop_current_call()
+            elif self.current_phone_number and self.phone_list:
+                # /start is still in flight, the number was already taken off the queue so put it back on top
+                self.phone_list.add_number(self.current_phone_number, row=0)
             self.current_session_id = None
             self.current_phone_number = None
-            self.start_button.setText("Start")
-            self.start_button.setStyleSheet("background-color: #28a745; padding: 10px; border-radius: 5px;")
-            self.status_label.setText("Status: Stopped")
+            self._reset_to_idle("Status: Stopped")
+
+    def _reset_to_idle(self, status: str) -> None:
+        """Stop auto-dialing and put the Start button back"""
+        self.is_auto_dialing = False
+        self.start_button.setText("Start")
+        set_button_state(self.start_button, "idle")
+        self.status_label.setText(status)
 
     def _stop_current_call(self) -> None:
         """Tell the backend to stop the current session"""
-        try:
-            requests.post(
-                "http://localhost:5000/stop",
-                json={"session_id": self.current_session_id},
-                timeout=5
-            )
-        except requests.ConnectionError:
-            pass
+        self.backend.post("/stop", {"session_id": self.current_session_id})
 
     def _dial_next_number(self) -> None:
         """Take the next number from the queue and start a call"""
@@ -102,103 +279,80 @@ class AutoDialControl(QWidget):
             return
 
         if not self.phone_list:
-            print("[AUTO-DIAL] No phone list connected!")
+            logger.warning("[AUTO-DIAL] No phone list connected!")
             return
 
         # Take the top number, if there are none the queue is empty, so stop
         next_item = self.phone_list.take_top_number()
         if not next_item:
-            print("[AUTO-DIAL] Queue empty, stopping")
-            self.is_auto_dialing = False
-            self.start_button.setText("Start")
-            self.start_button.setStyleSheet("background-color: #28a745; padding: 10px; border-radius: 5px;")
-            self.status_label.setText("Status: Queue empty")
+            logger.info("[AUTO-DIAL] Queue empty, stopping")
+            self._reset_to_idle("Status: Queue empty")
             return
 
         phone_number = next_item.text()
         self.current_phone_number = phone_number
-        print(f"[AUTO-DIAL] Calling: {phone_number}")
+        self.dial_attempt += 1
+        attempt = self.dial_attempt
+        logger.info("[AUTO-DIAL] Calling: %s", phone_number)
         self.status_label.setText(f"Status: Calling {phone_number}...")
 
-        # Call the phone number
-        try:
-            response = requests.post(
-                "http://localhost:5000/start",
-                json={"caller_phone": phone_number},
-                timeout=10
-            )
-            if response.status_code == 200:
-                self.current_session_id = response.json().get('session_id')
-                # Start the polling loop to detect when this call finishes, if there are no session, move on to the next number
-                self.poll_timer.start(self.SESSION_POLL_FREQ)  # when timeout, call _check_call_finished()
-            else:
-                print(f"[AUTO-DIAL] Call failed: {response.text}")
-                if self.failed_list and self.current_phone_number:
-                    self.failed_list.add_number(self.current_phone_number)
-                self.current_phone_number = None
-                self.status_label.setText(f"Status: Call failed, moving on...")
-                self._schedule_next_call()
-        except requests.ConnectionError:
-            print("[AUTO-DIAL] Backend not running!")
+        # Call the phone number, the answer arrives in _on_call_started()
+        self.backend.post(
+            "/start",
+            {"caller_phone": phone_number},
+            lambda status_code, data: self._on_call_started(attempt, status_code, data),
+            timeout=10000
+        )
+
+    def _on_call_started(self, attempt: int, status_code: int | None, data: dict) -> None:
+        if not self.is_auto_dialing or attempt != self.dial_attempt:
+            # Auto-dial was stopped while the call was being placed, hang it up again
+            if status_code == 200:
+                self.backend.post("/stop", {"session_id": data.get('session_id')})
+            return
+
+        if status_code == 200:
+            self.current_session_id = data.get('session_id')
+            # Wait for this call to finish, _on_session_ended() then moves on to the next number
+            self.session_watcher.watch(self.current_session_id)
+        elif status_code is not None:
+            logger.warning("[AUTO-DIAL] Call failed: %s", data)
             if self.failed_list and self.current_phone_number:
                 self.failed_list.add_number(self.current_phone_number)
             self.current_phone_number = None
-            self.status_label.setText("Status: Backend not running")
-            self.is_auto_dialing = False
-            self.start_button.setText("Start")
-            self.start_button.setStyleSheet("background-color: #28a745; padding: 10px; border-radius: 5px;")
-
-    def _check_call_finished(self) -> None:
-        """Poll backend to see if the current call session has ended"""
-        if not self.current_session_id:
-            self.poll_timer.stop()
-            return
-
-        try:
-            response = requests.get("http://localhost:5000/status", timeout=5)
-            data = response.json()
-            sessions = data.get('sessions', [])
-
-            # Check if our session is still in the active list
-            still_active = any(
-                s['session_id'] == self.current_session_id
-                for s in sessions
-            )
-
-            if not still_active:
-                # Call is done — check if it failed or succeeded
-                print(f"[AUTO-DIAL] Session {self.current_session_id} finished")
-                self._check_call_result()
-                self.poll_timer.stop()
-                self.current_session_id = None
-                self.current_phone_number = None
-                self.status_label.setText("Status: Call finished, waiting...")
-                self._schedule_next_call()
-
+            self.status_label.setText(f"Status: Call failed, moving on...")
+            self._schedule_next_call()
+        else:
+            logger.warning("[AUTO-DIAL] Backend not running!")
+            if self.failed_list and self.current_phone_number:
+                self.failed_list.add_number(self.current_phone_number)
+            self.current_phone_number = None
+            self._reset_to_idle("Status: Backend not running")
 
-        except requests.ConnectionError:
-            pass
+    def _on_session_ended(self, session_id: str, call_result: dict | None) -> None:
+        """The backend dropped the current call session"""
+        if session_id != self.current_session_id:
+            return
 
-    def _check_call_result(self) -> None:
-        """Check backend for the call result and move to failed list if needed"""
-        if not self.current_session_id or not self.current_phone_number:
+        # Call is done — check if it failed or succeeded
+        logger.info("[AUTO-DIAL] Session %s finished", session_id)
+        self._record_call_result(self.current_phone_number, call_result)
+        self.current_session_id = None
+        self.current_phone_number = None
+        self.status_label.setText("Status: Call finished, waiting...")
+        self._schedule_next_call()
+
+    def _record_call_result(self, phone_number: str, call_result: dict | None) -> None:
+        """Move the number to the failed list if the call did not go through"""
+        if not phone_number or not call_result:
             return
-        try:
-            response = requests.get(
-                f"http://localhost:5000/call-result/{self.current_session_id}",
-                timeout=5
-            )
-            if response.status_code == 200:
-                data = response.json()
-                result = data.get('result', 'unknown')
-                if result in ('no_answer', 'failed'):
-                    print(f"[AUTO-DIAL] Call failed ({result}): {self.current_phone_number}")
-                    if self.failed_list:
-                        self.failed_list.add_number(self.current_phone_number)
-                else:
-                    print(f"[AUTO-DIAL] Call result: {result}")
-        except requests.ConnectionError:
-            pass
+        result = call_result.get('result', 'unknown')
+        if result in ('no_answer', 'failed'):
+            logger.warning("[AUTO-DIAL] Call failed (%s): %s", result, phone_number)
+            if self.failed_list:
+                self.failed_list.add_number(phone_number)
+        else:
+            logger.info("[AUTO-DIAL] Call result: %s", result)
 
     def _schedule_next_call(self) -> None:
         """Wait the configured delay then dial the next number"""
@@ -207,7 +361,7 @@ class AutoDialControl(QWidget):
         delay_ms = int(self.delay_spin_box.value() * 1000)
         if delay_ms < 100:
             delay_ms = 1000
-        QTimer.singleShot(delay_ms, self._dial_next_number)
+        self.next_call_timer.start(delay_ms)
 
 
 
@@ -215,11 +369,10 @@ class AutoDialControl(QWidget):
 
 class PhoneList(QWidget):
 
-    SESSION_POLL_FREQ = 2000  # ms
-
     def __init__(self):
         super().__init__()
-        layout = QVBoxLayout(self)
+        self.setUpdatesEnabled(False)  # No repaints while the widget tree is being built
+        layout = QVBoxLayout()
         line_edit_layout = QHBoxLayout()
         edit_buttons_layout = QHBoxLayout()
 
@@ -228,44 +381,50 @@ class PhoneList(QWidget):
         self.current_session_id: str = None
         self.current_phone_number: str = None
         self.failed_list: 'FailedCallsList' = None
+        self._queued: set[str] = set()  # Numbers currently in the queue, for O(1) duplicate checks
 
-        # Timer to poll backend for manual call status
-        self.poll_timer = QTimer()
-        self.poll_timer.timeout.connect(self._check_call_finished)
+        # Backend calls, and what tells us when a manual call has ended
+        self.backend = BackendClient(self)
+        self.session_watcher = SessionWatcher(self.backend.network, self)
+        self.session_watcher.session_ended.connect(self._on_session_ended)
         
         # The list
         self.list_widget = QListWidget()
         list_title = QLabel("Call Queue")
-        list_title.setFont(QFont("Arial", 16, 700))
+        list_title.setFont(get_section_font())
 
         # Line edit
         self.line_edit = QLineEdit()
         self.line_edit.setPlaceholderText("Enter number and press Enter")
         self.line_edit.returnPressed.connect(self.add_item)
+        self.line_edit.textEdited.connect(lambda _text: self._set_line_edit_invalid(False))
 
+        # Enter in the line edit adds the number, the button only adds on an actual click
         add_button = QPushButton("Add")
-        add_button.pressed.connect(self.add_item)
+        add_button.setAutoDefault(False)
+        add_button.clicked.connect(self.add_item)
         line_edit_layout.addWidget(self.line_edit)
         line_edit_layout.addWidget(add_button)
 
         # Edit buttons
         move_up_button = QPushButton("↑")
-        move_up_button.setStyleSheet("background-color: #e8e9e8; color: black;")
+        move_up_button.setObjectName("moveUpButton")
         move_up_button.pressed.connect(self._move_entry_up)
         edit_buttons_layout.addWidget(move_up_button)
 
         move_down_button = QPushButton("↓")
-        move_down_button.setStyleSheet("background-color: #e8e9e8; color: black;")
+        move_down_button.setObjectName("moveDownButton")
         move_down_button.pressed.connect(self._move_entry_down)
         edit_buttons_layout.addWidget(move_down_button)
 
         delete_button = QPushButton("Delete")
-        delete_button.setStyleSheet("background-color: #ff2400;")
+        delete_button.setObjectName("deleteButton")
         delete_button.pressed.connect(self._delete_selected)
         edit_buttons_layout.addWidget(delete_button)
 
         self.call_button = QPushButton("Call")
-        self.call_button.setStyleSheet("background-color: #0018f9;")
+        self.call_button.setObjectName("callButton")
+        self.call_button.setProperty("state", "idle")
         self.call_button.pressed.connect(self._on_call_button_pressed)
 
         # Assemble the final widget
@@ -274,95 +433,94 @@ class PhoneList(QWidget):
         layout.addLayout(line_edit_layout)
         layout.addLayout(edit_buttons_layout)
         layout.addWidget(self.call_button)
+        self.setLayout(layout)
 
-        # Load list
+        # Load list, then save it shortly after every change so a crash loses at most the last second
         self._load_list()
+        self.save_timer = make_save_timer(self, self.list_widget, self.save_list)
+        self.setUpdatesEnabled(True)
     
     def add_item(self):
-        text = self.line_edit.text().strip()
-        if text:
-            self.list_widget.addItem(text)
+        text = PHONE_NUMBER_SEPARATORS.sub("", self.line_edit.text())
+        if not text:
+            return
+        if not PHONE_NUMBER_PATTERN.fullmatch(text):
+            # Never let it reach the backend, flag it until the user edits the number
+            self._set_line_edit_invalid(True)
+            return
+        if self.add_number(text):
             self.line_edit.clear()
 
+    def _set_line_edit_invalid(self, invalid: bool) -> None:
+        if self.line_edit.property("invalid") != invalid:
+            self.line_edit.setProperty("invalid", invalid)
+            self.line_edit.style().unpolish(self.line_edit)
+            self.line_edit.style().polish(self.line_edit)
+
+    def add_number(self, phone_number: str, row: int = None) -> bool:
+        """Queue a number unless it is already queued. Returns True if it was added"""
+        if phone_number in self._queued:
+            return False
+        self._queued.add(phone_number)
+        if row is None:
+            self.list_widget.addItem(phone_number)
+        else:
+            self.list_widget.insertItem(row, phone_number)
+        return True
+
+    def add_numbers(self, phone_numbers: list[str]) -> None:
+        """Queue several numbers at the end in one go, skipping any already queued"""
+        new_numbers = [number for number in dict.fromkeys(phone_numbers) if number not in self._queued]
+        self._queued.update(new_numbers)
+        self.list_widget.addItems(new_numbers)
+
 
     def reset_button(self) -> None:
         self.call_button.setText("Call")
-        self.call_button.setStyleSheet("background-color: #0018f9;")
+        set_button_state(self.call_button, "idle")
         self.is_in_call = False
 
 
-    def _check_call_finished(self) -> None:
-        """Poll backend to detect when a manual call ends"""
-        if not self.current_session_id:
-            self.poll_timer.stop()
+    def _on_session_ended(self, session_id: str, call_result: dict | None) -> None:
+        """The backend dropped the manual call's session"""
+        if session_id != self.current_session_id:
             return
 
-        try:
-            response = requests.get("http://localhost:5000/status", timeout=5)
-            data = response.json()
-            sessions = data.get('sessions', [])
-
-            still_active = any(
-                s['session_id'] == self.current_session_id
-                for s in sessions
-            )
+        logger.info("Session %s ended", session_id)
+        # Check call result and add to failed list if needed
+        self._record_call_result(self.current_phone_number, call_result)
+        self.current_session_id = None
+        self.current_phone_number = None
+        self.reset_button()
 
-            if not still_active:
-                print(f"[FRONTEND] Session {self.current_session_id} ended")
-                self.poll_timer.stop()
-                # Check call result and add to failed list if needed
-                self._check_call_result()
-                self.current_session_id = None
-                self.current_phone_number = None
-                self.reset_button()
-
-        except requests.ConnectionError:
-            pass
-
-    def _check_call_result(self) -> None:
-        """Check backend for the call result and move to failed list if needed"""
-        if not self.current_session_id or not self.current_phone_number:
+    def _record_call_result(self, phone_number: str, call_result: dict | None) -> None:
+        """Move the number to the failed list if the call did not go through"""
+        if not phone_number or not call_result:
             return
-        try:
-            response = requests.get(
-                f"http://localhost:5000/call-result/{self.current_session_id}",
-                timeout=5
-            )
-            if response.status_code == 200:
-                data = response.json()
-                result = data.get('result', 'unknown')
-                if result in ('no_answer', 'failed'):
-                    print(f"[FRONTEND] Call failed ({result}): {self.current_phone_number}")
-                    if self.failed_list:
-                        self.failed_list.add_number(self.current_phone_number)
-                else:
-                    print(f"[FRONTEND] Call result: {result}")
-        except requests.ConnectionError:
-            pass
+        result = call_result.get('result', 'unknown')
+        if result in ('no_answer', 'failed'):
+            logger.warning("Call failed (%s): %s", result, phone_number)
+            if self.failed_list:
+                self.failed_list.add_number(phone_number)
+        else:
+            logger.info("Call result: %s", result)
 
     def take_top_number(self) -> str:
         first_item = self.list_widget.takeItem(0)  # Returns a QListWidgetItem (use .text() to retrieve content)
 
         # If exist return, else return None
         if first_item:
+            self._queued.discard(first_item.text())
             return first_item
         return None
     
     
     def _load_list(self) -> None:
-        try:
-            with open("phone_numbers_in_queue.txt", "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:  # Skip empty lines
-                        self.list_widget.addItem(line)
-        except FileNotFoundError:
-            pass  # File doesn't exist yet, that's fine
+        self.add_numbers(load_list_file("phone_numbers_in_queue.txt"))
 
     def save_list(self) -> None:
-        with open("phone_numbers_in_queue.txt", "w") as f:
-            for i in range(self.list_widget.count()):
-                f.write(self.list_widget.item(i).text() + "\n")
+        self.save_timer.stop()
+        save_list_file(self.list_widget, "phone_numbers_in_queue.txt")
 
 
     ####################
@@ -372,6 +530,7 @@ class PhoneList(QWidget):
         current_item = self.list_widget.currentItem()
         if current_item:
             self.list_widget.takeItem(self.list_widget.row(current_item))
+            self._queued.discard(current_item.text())
 
     def _move_entry_up(self) -> None:
         current_row = self.list_widget.currentRow()
@@ -394,69 +553,70 @@ class PhoneList(QWidget):
             if current_item:
                 # Remove from queue
                 self.list_widget.takeItem(self.list_widget.row(current_item))
+                self._queued.discard(current_item.text())
             else:
                 # Check the top of the list if there are none selected
                 current_item = self.take_top_number()
                 if not current_item:
-                    print("[FRONTEND] No phone number selected")
+                    logger.warning("No phone number selected")
                     self.reset_button()
                     return
             phone_number = current_item.text()
             self.current_phone_number = phone_number
-            # Finally, call the backend
-            try:
-                # UI change telling that were processing the call function
-                response = requests.post(
-                    "http://localhost:5000/start",
-                    json={"caller_phone": phone_number}
-                )
-
-                # Success
-                if response.status_code == 200:
-                    data = response.json()
-                    print(f"[FRONTEND] Call started: {data}")
-                    self.current_session_id = data.get('session_id')
-
-                    # Change the UI
-                    self.is_in_call = True
-                    self.call_button.setText("End Call")
-                    self.call_button.setStyleSheet("background-color: #dc3545;")
-
-                    # Start polling to detect when call ends
-                    self.poll_timer.start(self.SESSION_POLL_FREQ)
-
-
-                # Sadness
-                else:
-                    print(f"[FRONTEND] Failed to start call: {response.text}")
-                    self.list_widget.insertItem(0, phone_number)
-                    self.current_phone_number = None
-                    self.reset_button()
 
-            except requests.ConnectionError:
-                print("[FRONTEND] Backend not running!")
-                self.list_widget.insertItem(0, phone_number)
-                self.current_phone_number = None
-                self.reset_button()
+            # UI change telling that were processing the call function
+            self.call_button.setText("Calling...")
+            self.call_button.setEnabled(False)
+
+            # Finally, call the backend, the answer arrives in _on_call_started()
+            self.backend.post(
+                "/start",
+                {"caller_phone": phone_number},
+                lambda status_code, data: self._on_call_started(phone_number, status_code, data),
+                timeout=10000
+            )
 
         # Call is already on going so drop it
         else:
-            self.poll_timer.stop()
-            try:
-                response = requests.post(
-                    "http://localhost:5000/stop",
-                    json={"session_id": self.current_session_id}
-                )
-                if response.status_code == 200:
-                    print(f"[FRONTEND] Call ended: {response.json()}")
-                else:
-                    print(f"[FRONTEND] Failed to end call: {response.text}")
-            except requests.ConnectionError:
-                print("[FRONTEND] Backend not running!")
-            finally:
-                self.current_session_id = None
-                self.current_phone_number = None
-                self.reset_button()
+            self.session_watcher.cancel()
+            self.backend.post("/stop", {"session_id": self.current_session_id}, self._on_call_stopped)
+            self.current_session_id = None
+            self.current_phone_number = None
+            self.reset_button()
+
+    def _on_call_started(self, phone_number: str, status_code: int | None, data: dict) -> None:
+        self.call_button.setEnabled(True)
+
+        # Success
+        if status_code == 200:
+            logger.info("Call started: %s", data)
+            self.current_session_id = data.get('session_id')
+
+            # Change the UI
+            self.is_in_call = True
+            self.call_button.setText("End Call")
+            set_button_state(self.call_button, "running")
+
+            # Wait for the backend to report the call has ended
+            self.session_watcher.watch(self.current_session_id)
+
+        # Sadness
+        else:
+            if status_code is not None:
+                logger.warning("Failed to start call: %s", data)
+            else:
+                logger.warning("Backend not running!")
+            self.add_number(phone_number, row=0)
+            self.current_phone_number = None
+            self.reset_button()
+
+    def _on_call_stopped(self, status_code: int | None, data: dict) -> None:
+        if status_code == 200:
+            logger.info("Call ended: %s", data)
+        elif status_code is not None:
+            logger.warning("Failed to end call: %s", data)
+        else:
+            logger.warning("Backend not running!")
 
 
 
@@ -479,20 +639,20 @@ class FailedCallsList(QWidget):
         buttons_layout = QHBoxLayout()
 
         title = QLabel("Failed Calls")
-        title.setFont(QFont("Arial", 16, 700))
+        title.setFont(get_section_font())
 
         self.list_widget = QListWidget()
 
         retry_button = QPushButton("Retry")
-        retry_button.setStyleSheet("background-color: #ffc107; color: black;")
+        retry_button.setObjectName("retryButton")
         retry_button.pressed.connect(self._retry_selected)
 
         retry_all_button = QPushButton("Retry All")
-        retry_all_button.setStyleSheet("background-color: #ffc107; color: black;")
+        retry_all_button.setObjectName("retryAllButton")
         retry_all_button.pressed.connect(self._retry_all)
 
         clear_button = QPushButton("Clear")
-        clear_button.setStyleSheet("background-color: #dc3545;")
+        clear_button.setObjectName("clearButton")
         clear_button.pressed.connect(self._clear_all)
 
         buttons_layout.addWidget(retry_button)
@@ -504,6 +664,7 @@ class FailedCallsList(QWidget):
         layout.addLayout(buttons_layout)
 
         self._load_list()
+        self.save_timer = make_save_timer(self, self.list_widget, self.save_list)
 
     def add_number(self, phone_number: str) -> None:
         self.list_widget.addItem(phone_number)
@@ -511,52 +672,38 @@ class FailedCallsList(QWidget):
     def _retry_selected(self) -> None:
         current_item = self.list_widget.currentItem()
         if current_item and self.phone_list:
-            self.phone_list.list_widget.addItem(current_item.text())
+            self.phone_list.add_number(current_item.text())
             self.list_widget.takeItem(self.list_widget.row(current_item))
 
     def _retry_all(self) -> None:
         if not self.phone_list:
             return
-        while self.list_widget.count() > 0:
-            item = self.list_widget.takeItem(0)
-            self.phone_list.list_widget.addItem(item.text())
+        # Move everything across in one batch, not a row at a time
+        numbers = [self.list_widget.item(i).text() for i in range(self.list_widget.count())]
+        self.list_widget.clear()
+        self.phone_list.add_numbers(numbers)
 
     def _clear_all(self) -> None:
         self.list_widget.clear()
 
     def _load_list(self) -> None:
-        try:
-            with open("failed_numbers.txt", "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        self.list_widget.addItem(line)
-        except FileNotFoundError:
-            pass
+        self.list_widget.addItems(load_list_file("failed_numbers.txt"))
 
     def save_list(self) -> None:
-        with open("failed_numbers.txt", "w") as f:
-            for i in range(self.list_widget.count()):
-                f.write(self.list_widget.item(i).text() + "\n")
+        self.save_timer.stop()
+        save_list_file(self.list_widget, "failed_numbers.txt")
 
 
 ################################################################################
 # MAIN WINDOW
 ################################################################################
 
-class MainWindow(QWidget):
+class MainWindow(BackendWindow):
+    BACKEND_SCRIPT = Path("backend/odin/screening_agent/app_v2.py")
+
     def __init__(self):
         super().__init__()
-        ###############################################################################
-        # VARIABLES AND CLASS SETUP
-        ###############################################################################
-        # State variables
-        self.is_backend_on = False
-        self.process = None
-        self.health_check_timer = None
-        self.health_check_start_time = None
-        self.health_check_timeout = 15  # seconds
-
+        self.setUpdatesEnabled(False)  # No repaints while the widget tree is being built
         ###############################################################################
         # UI SETUP
         ###############################################################################
@@ -571,22 +718,20 @@ class MainWindow(QWidget):
         # Title
         title = QLabel("HAHS AI POWERED SCREENING ASSISTANT")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setFont(QFont("Arial", 512, 700))
+        title.setFont(get_title_font())
 
         # HAHS Banner
-        script_dir = Path(__file__).parent.parent  # frontend_qt folder
-        image_path = script_dir / "hahs_logo.png"
-        pixmap = QPixmap(str(image_path)).scaled(300, 75)
         app_banner = QLabel()
         app_banner.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        app_banner.setPixmap(pixmap)
+        app_banner.setPixmap(get_banner())
 
         # The start button
         start_backend_label = QLabel("Backend")
-        start_backend_label.setFont(QFont("Arial", 16, 700))
+        start_backend_label.setFont(get_section_font())
         self.button = QPushButton("Start")
         self.button.clicked.connect(self.on_button_click)  # Connect click to function
         self.button.setObjectName("startButton")
+        self.button.setProperty("state", "idle")  # Colour comes from the application style sheet
 
         self.status = QLabel("Status: App stopped")
 
@@ -617,23 +762,7 @@ class MainWindow(QWidget):
         layout.addStretch()  # Flexible space instead of fixed, do this to prevent elements not being squished
         layout.addWidget(self.status)
         self.setLayout(layout)
-
-        # Basic dark styling
-        ##ffffff; Black
-        ##282c34; Greyish black
-        ##2c041c; Wine purple
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2c041c; 
-                color: white;
-                font-size: 16px;
-            }
-            QPushButton {
-                background-color: #28a745;
-                padding: 10px;
-                border-radius: 5px;
-            }
-        """)
+        self.setUpdatesEnabled(True)
 
         ###############################################################################
         # BACKGROUND JOBS
@@ -643,122 +772,6 @@ class MainWindow(QWidget):
     ###############################################################################
     # SIGNAL CALL BACKS
     ###############################################################################
-    def on_button_click(self) -> None:
-        """
-        Called when main start button clicked
-        """
-        print("Button clicked!")
-
-        if not self.is_backend_on:
-            # UI Changes, set it to starting... Let the functions inside _start_backend() change 
-            # the button to either STOP or START (FAILED)
-            self.button.setText("Starting...")
-            self.button.setStyleSheet("background-color: #6c757d; padding: 10px; border-radius: 5px;")
-            self.button.setEnabled(False)
-
-            # Logic
-            self._start_backend()
-        else:
-            # UI Changes
-            self.button.setText("Start")
-            self.button.setStyleSheet("background-color: #28a745; padding: 10px; border-radius: 5px;")
-
-            # Logic
-            self._stop_backend()
-            self.is_backend_on = False
-        
-
-
-    ###############################################################################
-    # ACTION FUNCTIONS
-    ###############################################################################
-    def _start_backend(self):
-        # Get the path to odin app.py
-        project_root = Path(__file__).parent.parent.parent  # odin -> frontend_qt -> Thoth
-        script_path = project_root / "backend" / "odin" / "screening_agent" / "app_v2.py"
-
-        # Get python from venv
-        if sys.platform == "win32":
-            python_exe = project_root / ".venv" / "Scripts" / "python.exe"
-        else:
-            python_exe = project_root / ".venv" / "bin" / "python"
-
-        print(f"[FRONTEND QT] Starting: {python_exe} {script_path}")
-
-        # Start the process (non-blocking)
-        self.process = subprocess.Popen(
-            [str(python_exe), str(script_path)],
-            cwd=str(script_path.parent),  # Run from the script's directory
-        )
-
-        # Start health check polling
-        self.health_check_start_time = time.time()
-        self.health_check_timer = QTimer()
-        self.health_check_timer.timeout.connect(self._check_backend_health)
-        self.health_check_timer.start(500)  # Check every 500ms
-
-
-    def _check_backend_health(self):
-        """Poll the backend health endpoint until it responds or times out"""
-        elapsed_time = time.time() - self.health_check_start_time
-
-        # Check for timeout
-        if elapsed_time > self.health_check_timeout:
-            print("[FRONTEND QT] Backend startup timeout!")
-            self.health_check_timer.stop()
-            self.button.setText("Start (Failed)")
-            self.button.setStyleSheet("background-color: #ffc107; padding: 10px; border-radius: 5px;")
-            self.button.setEnabled(True)
-
-            # Clean up the process
-            if self.process:
-                self.process.terminate()
-                self.process = None
-            return
-
-        # Try to ping the health endpoint
-        try:
-            response = requests.get("http://localhost:5000/health", timeout=1)
-            if response.status_code == 200:
-                print(f"[FRONTEND QT] Backend started successfully in {elapsed_time:.2f}s")
-                self.health_check_timer.stop()
-
-                # Update state and UI to running
-                self.is_backend_on = True
-                self.button.setText("Stop")
-                self.button.setStyleSheet("background-color: #dc3545; padding: 10px; border-radius: 5px;")
-                self.button.setEnabled(True)
-                self.status.setText("Status: Application is running!")
-        except (requests.ConnectionError, requests.Timeout):
-            # Backend not ready yet, keep polling
-            pass
-        except Exception as e:
-            print(f"[FRONTEND QT] Error checking health: {e}")
-
-    def _stop_backend(self):
-        # Check if process is running and exists
-        if hasattr(self, 'process') and self.process:
-            print("[FRONTEND QT] Stopping backend...")
-            self.process.terminate()
-
-            # Wait for process to terminate (timeout after 3 seconds)
-            try:
-                self.process.wait(timeout=3)
-                print("[FRONTEND QT] Backend stopped gracefully")
-            except subprocess.TimeoutExpired:
-                print("[FRONTEND QT] Force killing backend...")
-                self.process.kill()
-                self.process.wait()
-                print("[FRONTEND QT] Backend force stopped")
-
-            self.process = None
-            self.status.setText("Status: Stopped")
-    
-    def _reset_button(self):
-        self.button.setText("Start")
-        self.button.setStyleSheet("background-color: #28a745; padding: 10px; border-radius: 5px;")
-        self.button.setEnabled(True)
-
     def closeEvent(self, event):
         self.phone_list.save_list()
         self.failed_list.save_list()
@@ -768,7 +781,11 @@ class MainWindow(QWidget):
 
 # Run the app
 if __name__ == "__main__":
+    # THOTH_DEBUG=1 brings back the per-click and startup diagnostics
+    log_level = logging.DEBUG if os.environ.get("THOTH_DEBUG") == "1" else logging.WARNING
+    logging.basicConfig(level=log_level, format="%(asctime)s %(levelname)s %(name)s %(message)s")
     app = QApplication(sys.argv)
+    app.setStyleSheet(_QSS)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
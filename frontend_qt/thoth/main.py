@@ -2,19 +2,35 @@
 Simplest PyQt App - Text and a Button
 """
 
+import logging
+import os
 import sys
-import subprocess
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication, QCheckBox, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFrame, QTimeEdit
-from PyQt6.QtCore import Qt, QTimer, QTime, pyqtSignal
-from PyQt6.QtGui import QPixmap, QFont
+from PyQt6.QtCore import Qt, QTimer, QTime, QDateTime, pyqtSignal
 
-import requests
-import time
 sys.path.insert(0, str(Path(__file__).parent.parent))
 import utils
+from backend_window import BackendWindow, BUTTON_STATE_STYLE, get_banner, get_title_font
+
+logger = logging.getLogger("thoth.frontend_qt")
+
+# Basic dark styling, applied once on the QApplication so every widget inherits it
+##ffffff;
+##282c34
+_QSS = """
+    QWidget {
+        background-color: #282c34; 
+        color: white;
+        font-size: 16px;
+    }
+    QPushButton {
+        background-color: #28a745;
+        padding: 10px;
+        border-radius: 5px;
+    }
+""" + BUTTON_STATE_STYLE
 
-AUTO_START_CHECK_FREQ = 20000  #ms
 
 ################################################################################
 # SUB WIDGETS
@@ -27,11 +43,11 @@ class AfterHourTimeSelect(QWidget):
         def_start_time: list = utils.time_string_to_int(utils.load_from_config("DEFAULT_AUTO_START_TIME"))
         def_stop_time: list = utils.time_string_to_int(utils.load_from_config("DEFAULT_AUTO_STOP_TIME"))
         if def_start_time == []:
-            print("WARNING: Default start time cannot be read from settings. Fallback value used: 17:30.")
+            logger.warning("Default start time cannot be read from settings. Fallback value used: 17:30.")
             def_start_time = [17, 30]
         if def_stop_time == []:
-            print("WARNING: Default stop time cannot be read from settings. Fallback value used: 8:30.")
-            def_start_time = [8, 30]
+            logger.warning("Default stop time cannot be read from settings. Fallback value used: 8:30.")
+            def_stop_time = [8, 30]
 
         # UI
         layout = QVBoxLayout()
@@ -63,21 +79,34 @@ class AfterHourTimeSelect(QWidget):
         layout.addLayout(stop_time_layout)
         self.setLayout(layout)
 
+        # Cache the selected times, only refreshed when the user edits them
+        self._start_time: list = [def_start_time[0], def_start_time[1]]
+        self._stop_time: list = [def_stop_time[0], def_stop_time[1]]
+        self.start_time.timeChanged.connect(self._on_start_time_changed)
+        self.stop_time.timeChanged.connect(self._on_stop_time_changed)
+
+    def _on_start_time_changed(self, new_time: QTime) -> None:
+        self._start_time = [new_time.hour(), new_time.minute()]
+
+    def _on_stop_time_changed(self, new_time: QTime) -> None:
+        self._stop_time = [new_time.hour(), new_time.minute()]
+
     # Getter for start time
     # Returns start time [hour, minute]
     def get_start_time(self) -> list[int]:
-        return[self.start_time.time().hour(), self.start_time.time().minute()]
+        return list(self._start_time)
 
     # Getter for stop time
     # Returns stop time [hour, minute]
     def get_stop_time(self) -> list[int]:
-        return[self.stop_time.time().hour(), self.stop_time.time().minute()]
+        return list(self._stop_time)
 
         
 class AutoStartWidget(QWidget):
     # Signals must be class attributes (not in __init__)
     auto_start_enabled = pyqtSignal(list, list)  # (start_time, stop_time)
     auto_start_disabled = pyqtSignal()
+    auto_start_times_changed = pyqtSignal(list, list)  # (start_time, stop_time)
 
     def __init__(self):
         super().__init__()
@@ -90,6 +119,8 @@ class AutoStartWidget(QWidget):
         # Time select
         self.time_select = AfterHourTimeSelect()
         self.time_select.setVisible(False)
+        self.time_select.start_time.timeChanged.connect(self.on_time_changed)
+        self.time_select.stop_time.timeChanged.connect(self.on_time_changed)
 
         # Add to layout
         layout.addWidget(self.autostart_checkbox)
@@ -113,23 +144,20 @@ class AutoStartWidget(QWidget):
             self.time_select.hide()
             self.auto_start_disabled.emit()
 
+    def on_time_changed(self, _new_time):
+        if self.autostart_checkbox.isChecked():
+            self.auto_start_times_changed.emit(self.time_select.get_start_time(), self.time_select.get_stop_time())
+
 ################################################################################
 # MAIN WINDOW
 ################################################################################
 
-class MainWindow(QWidget):
+class MainWindow(BackendWindow):
+    BACKEND_SCRIPT = Path("backend/thoth/core/call_assistant/app_v5.py")
+
     def __init__(self):
         super().__init__()
-        ###############################################################################
-        # VARIABLES AND CLASS SETUP
-        ###############################################################################
-        # State variables
-        self.is_backend_on = False
-        self.process = None
-        self.health_check_timer = None
-        self.health_check_start_time = None
-        self.health_check_timeout = 15  # seconds
-
+        self.setUpdatesEnabled(False)  # No repaints while the widget tree is being built
         ###############################################################################
         # UI SETUP
         ###############################################################################
@@ -144,20 +172,18 @@ class MainWindow(QWidget):
         # Title
         title = QLabel("HAHS AI POWERED ROSTERING CALL ASSISTANT")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setFont(QFont("Arial", 512, 700))
+        title.setFont(get_title_font())
 
         # HAHS Banner
-        script_dir = Path(__file__).parent.parent  # frontend_qt folder
-        image_path = script_dir / "hahs_logo.png"
-        pixmap = QPixmap(str(image_path)).scaled(300, 75)
         app_banner = QLabel()
         app_banner.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        app_banner.setPixmap(pixmap)
+        app_banner.setPixmap(get_banner())
 
         # The start button
         self.button = QPushButton("Start")
         self.button.clicked.connect(self.on_button_click)  # Connect click to function
         self.button.setObjectName("startButton")
+        self.button.setProperty("state", "idle")  # Colour comes from the application style sheet
 
         self.status = QLabel("Status: App stopped")
         #self.status.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -172,206 +198,105 @@ class MainWindow(QWidget):
         layout.addWidget(self.autostart_widget)
         self.autostart_widget.auto_start_enabled.connect(self._on_auto_start_enabled)
         self.autostart_widget.auto_start_disabled.connect(self._on_auto_start_disabled)
+        self.autostart_widget.auto_start_times_changed.connect(self._on_auto_start_times_changed)
 
         layout.addStretch()  # Flexible space instead of fixed, do this to prevent elements not being squished
         layout.addWidget(self.status)
         self.setLayout(layout)
-
-        # Basic dark styling
-        ##ffffff;
-        ##282c34
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #282c34; 
-                color: white;
-                font-size: 16px;
-            }
-            QPushButton {
-                background-color: #28a745;
-                padding: 10px;
-                border-radius: 5px;
-            }
-        """)
+        self.setUpdatesEnabled(True)
 
         ###############################################################################
         # BACKGROUND JOBS
         ###############################################################################
-        self.autostart_timer = QTimer()
-        self.autostart_timer.timeout.connect(self._check_autostart_time)
+        # Sleeps until the next start/stop boundary instead of polling the clock.
+        # Precise so it never fires before the boundary and gets re-armed for the same minute.
+        self.autostart_timer = QTimer(self)
+        self.autostart_timer.setSingleShot(True)
+        self.autostart_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.autostart_timer.timeout.connect(self._fire_autostart)
+        self.autostart_times = None  # (start_time, stop_time) while auto-start is enabled
+        self.autostart_next_action = None  # "start" or "stop"
 
 
 
     ###############################################################################
     # SIGNAL CALL BACKS
     ###############################################################################
-    def on_button_click(self) -> None:
+    def _on_auto_start_enabled(self, start_time:list, stop_time:list) -> None:
         """
-        Called when main start button clicked
+        When the auto start check box is enabled
         """
-        print("Button clicked!")
+        logger.info("Auto-start enabled. Start: %s. Stop: %s", start_time, stop_time)
+        self.autostart_times = (start_time, stop_time)
+        self._arm_next_autostart()
 
-        if not self.is_backend_on:
-            # UI Changes, set it to starting... Let the functions inside _start_backend() change 
-            # the button to either STOP or START (FAILED)
-            self.button.setText("Starting...")
-            self.button.setStyleSheet("background-color: #6c757d; padding: 10px; border-radius: 5px;")
-            self.button.setEnabled(False)
 
-            # Logic
-            self._start_backend()
-        else:
-            # UI Changes
-            self.button.setText("Start")
-            self.button.setStyleSheet("background-color: #28a745; padding: 10px; border-radius: 5px;")
-
-            # Logic
-            self._stop_backend()
-            self.is_backend_on = False
-        
+    def _on_auto_start_disabled(self) -> None:
+        """
+        When the auto start check box is disabled
+        """
+        logger.info("Auto-start disabled")
+        self.autostart_timer.stop()
+        self.autostart_times = None
+        self.autostart_next_action = None
 
 
-    def _on_auto_start_enabled(self, start_time:list, stop_time:list) -> None:
+    def _on_auto_start_times_changed(self, start_time:list, stop_time:list) -> None:
         """
-        When the auto start check box is enabled
+        When the start/stop times are edited while auto start is enabled
         """
-        print(f"Auto-start enabled. Start: {start_time}. Stop: {stop_time}")
-        self.autostart_timer.start(AUTO_START_CHECK_FREQ)
-        pass
+        self.autostart_times = (start_time, stop_time)
+        self._arm_next_autostart()
 
 
-    def _on_auto_start_disabled(self) -> None:
+    def _arm_next_autostart(self) -> None:
         """
-        When the auto start check box is disabled
+        Arm autostart_timer for whichever of the start/stop times comes next
         """
-        print("Auto-start disabled")
-        self.autostart_timer.stop()
-        pass
-        
+        start_time, stop_time = self.autostart_times
+        now = QDateTime.currentDateTime()
+
+        def msecs_until(hour_minute: list) -> int:
+            target = QDateTime(now.date(), QTime(hour_minute[0], hour_minute[1]))
+            if now.msecsTo(target) <= 0:
+                target = target.addDays(1)  # Already passed today, wrap past midnight
+            return now.msecsTo(target)
+
+        to_start = msecs_until(start_time)
+        to_stop = msecs_until(stop_time)
+        if to_start <= to_stop:
+            self.autostart_next_action, delay = "start", to_start
+        else:
+            self.autostart_next_action, delay = "stop", to_stop
+
+        logger.info("Next auto %s in %.1f min", self.autostart_next_action, delay / 60000)
+        self.autostart_timer.start(delay)
 
-    def _check_autostart_time(self) -> None:
+
+    def _fire_autostart(self) -> None:
         """
-        Called everytime auto_start_timer has timed out. This is the loop that checks the auto start
+        Called when autostart_timer reaches the next start/stop time.
         It imitates a user pressing the start button.
         """
-        # [Hour, Minute] in 24h format
-        current_time: list = [QTime.currentTime().hour(), QTime.currentTime().minute()]
-        time_select_menu: AfterHourTimeSelect = self.autostart_widget.time_select
-        start_time: list = time_select_menu.get_start_time()
-        stop_time: list = time_select_menu.get_stop_time()
-
-        print(f"Checking for auto times. Current time: {current_time}. Start time: {start_time}. Stop time: {stop_time}.")
-
-        # Check START
-        start_time: list = time_select_menu.get_start_time()
-        stop_time: list = time_select_menu.get_stop_time()
-        if start_time[0] == current_time[0] and start_time[1] == current_time[1]:
-            if not self.is_backend_on:
+        if self.autostart_next_action == "start":
+            if self.process is None:  # Not already starting or running
                 self.on_button_click()
 
-        # Check STOP
-        elif stop_time[0] == current_time[0] and stop_time[1] == current_time[1]:
+        elif self.autostart_next_action == "stop":
             if self.is_backend_on:
                 self.on_button_click()
 
-
-
-    ###############################################################################
-    # ACTION FUNCTIONS
-    ###############################################################################
-    def _start_backend(self):
-        # Get the path to app_v3.py
-        project_root = Path(__file__).parent.parent.parent  # thoth -> frontend_qt -> Thoth
-        script_path = project_root / "backend" / "thoth" / "core" / "call_assistant" / "app_v5.py"
-
-        # Get python from venv
-        if sys.platform == "win32":
-            python_exe = project_root / ".venv" / "Scripts" / "python.exe"
-        else:
-            python_exe = project_root / ".venv" / "bin" / "python"
-
-        print(f"[FRONTEND QT] Starting: {python_exe} {script_path}")
-
-        # Start the process (non-blocking)
-        self.process = subprocess.Popen(
-            [str(python_exe), str(script_path)],
-            cwd=str(script_path.parent),  # Run from the script's directory
-        )
-
-        # Start health check polling
-        self.health_check_start_time = time.time()
-        self.health_check_timer = QTimer()
-        self.health_check_timer.timeout.connect(self._check_backend_health)
-        self.health_check_timer.start(500)  # Check every 500ms
-
-
-    def _check_backend_health(self):
-        """Poll the backend health endpoint until it responds or times out"""
-        elapsed_time = time.time() - self.health_check_start_time
-
-        # Check for timeout
-        if elapsed_time > self.health_check_timeout:
-            print("[FRONTEND QT] Backend startup timeout!")
-            self.health_check_timer.stop()
-            self.button.setText("Start (Failed)")
-            self.button.setStyleSheet("background-color: #ffc107; padding: 10px; border-radius: 5px;")
-            self.button.setEnabled(True)
-
-            # Clean up the process
-            if self.process:
-                self.process.terminate()
-                self.process = None
-            return
-
-        # Try to ping the health endpoint
-        try:
-            response = requests.get("http://localhost:5000/health", timeout=1)
-            if response.status_code == 200:
-                print(f"[FRONTEND QT] Backend started successfully in {elapsed_time:.2f}s")
-                self.health_check_timer.stop()
-
-                # Update state and UI to running
-                self.is_backend_on = True
-                self.button.setText("Stop")
-                self.button.setStyleSheet("background-color: #dc3545; padding: 10px; border-radius: 5px;")
-                self.button.setEnabled(True)
-                self.status.setText("Status: Application is running!")
-        except (requests.ConnectionError, requests.Timeout):
-            # Backend not ready yet, keep polling
-            pass
-        except Exception as e:
-            print(f"[FRONTEND QT] Error checking health: {e}")
-
-    def _stop_backend(self):
-        # Check if process is running and exists
-        if hasattr(self, 'process') and self.process:
-            print("[FRONTEND QT] Stopping backend...")
-            self.process.terminate()
-
-            # Wait for process to terminate (timeout after 3 seconds)
-            try:
-                self.process.wait(timeout=3)
-                print("[FRONTEND QT] Backend stopped gracefully")
-            except subprocess.TimeoutExpired:
-                print("[FRONTEND QT] Force killing backend...")
-                self.process.kill()
-                self.process.wait()
-                print("[FRONTEND QT] Backend force stopped")
-
-            self.process = None
-            self.status.setText("Status: Stopped")
-    
-    def _reset_button(self):
-        self.button.setText("Start")
-        self.button.setStyleSheet("background-color: #28a745; padding: 10px; border-radius: 5px;")
-        self.button.setEnabled(True)
-
-
+        self._arm_next_autostart()
 
 
 
 # Run the app
 if __name__ == "__main__":
+    # THOTH_DEBUG=1 brings back the per-click and startup diagnostics
+    log_level = logging.DEBUG if os.environ.get("THOTH_DEBUG") == "1" else logging.WARNING
+    logging.basicConfig(level=log_level, format="%(asctime)s %(levelname)s %(name)s %(message)s")
     app = QApplication(sys.argv)
+    app.setStyleSheet(_QSS)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
@@ -1,4 +1,29 @@
 import os
+import re
+from functools import lru_cache
+
+# "H:MM" or "HH:MM" 24h, ranges checked by the pattern itself
+_TIME_PATTERN = re.compile(r"([01]?\d|2[0-3]):([0-5]\d)")
+
+@lru_cache(maxsize=1)
+def _load_config() -> dict[str, str]:
+    """
+    Parses the whole setting.cfg file once, later lookups are served from memory
+
+    :return: setting name -> value, the first definition of a name wins
+    :rtype: dict[str, str]
+    """
+    config_path = os.path.join(os.path.dirname(__file__), "settings.cfg")
+    settings = {}
+
+    with open(config_path, "r") as f:
+        for line in f.read().splitlines():
+            line = line.partition("#")[0].strip()  # Remove comments
+            key, sep, value = line.partition("=")
+            if sep:
+                settings.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+    return settings
+
 
 def load_from_config(setting_name: str, default_value:str=None) -> str | None:
     """
@@ -9,19 +34,7 @@ def load_from_config(setting_name: str, default_value:str=None) -> str | None:
     :return: the setting value, or None if not found
     :rtype: str | None
     """
-    config_path = os.path.join(os.path.dirname(__file__), "settings.cfg")
-
-    with open(config_path, "r") as f:
-        for line in f:
-            line = line.split("#")[0].strip()  # Remove comments
-            if not line:
-                continue
-            if "=" in line:
-                key, value = line.split("=", 1)
-                if key.strip() == setting_name:
-                    value = value.strip().strip('"').strip("'")
-                    return value
-    return default_value
+    return _load_config().get(setting_name, default_value)
 
 
 
@@ -30,18 +43,12 @@ def time_string_to_int(time_string: str) -> list[int]:
     """
     Converts time in the string form "HH:MM" 24h to [HH, MM] int array
 
-    :param time_string: time in "HH:MM" 24h string format
+    :param time_string: time in "HH:MM" (or "H:MM") 24h string format
     :type time_string: str
     :return: [hours, minutes] as integers, or empty list if invalid
     :rtype: list[int]
     """
-    try:
-        parts = time_string.split(":")
-        if len(parts) != 2:
-            return []
-        hours, minutes = int(parts[0]), int(parts[1])
-        if 0 <= hours <= 23 and 0 <= minutes <= 59:
-            return [hours, minutes]
-    except ValueError:
-        pass
-    return []
\ No newline at end of file
+    match = _TIME_PATTERN.fullmatch(time_string.strip()) if time_string else None
+    if match is None:
+        return []
+    return [int(match[1]), int(match[2])]
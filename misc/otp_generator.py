@@ -3,11 +3,27 @@ OTP Code Generator
 Generates TOTP (Time-based One-Time Password) codes for authentication.
 """
 
+import base64
 import hmac
 import hashlib
-import struct
 import time
 import sys
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def _decode_secret(secret: str) -> bytes:
+    """Decode a base32 secret once; later ticks reuse the cached key."""
+    # Clean the secret: remove spaces, convert to uppercase
+    secret = secret.replace(" ", "").upper()
+
+    # Add padding if necessary for base32 decoding
+    secret += "=" * (-len(secret) % 8)
+
+    try:
+        return base64.b32decode(secret)
+    except Exception as e:
+        raise ValueError(f"Invalid base32 secret: {e}")
 
 
 def generate_totp(secret: str, interval: int = 30) -> str:
@@ -21,34 +37,23 @@ def generate_totp(secret: str, interval: int = 30) -> str:
     Returns:
         6-digit OTP code as string
     """
-    # Clean the secret: remove spaces, convert to uppercase
-    secret = secret.replace(" ", "").upper()
-
-    # Add padding if necessary for base32 decoding
-    padding = 8 - (len(secret) % 8)
-    if padding != 8:
-        secret += "=" * padding
-
-    # Decode base32 secret
-    import base64
-    try:
-        key = base64.b32decode(secret)
-    except Exception as e:
-        raise ValueError(f"Invalid base32 secret: {e}")
+    key = _decode_secret(secret)
 
     # Get current time counter
     counter = int(time.time()) // interval
 
-    # Convert counter to 8-byte big-endian
-    counter_bytes = struct.pack(">Q", counter)
-
-    # Generate HMAC-SHA1
-    hmac_hash = hmac.new(key, counter_bytes, hashlib.sha1).digest()
+    # Generate HMAC-SHA1 over the 8-byte big-endian counter
+    hmac_hash = hmac.new(key, counter.to_bytes(8, "big"), hashlib.sha1).digest()
 
     # Dynamic truncation
     offset = hmac_hash[-1] & 0x0F
-    truncated = struct.unpack(">I", hmac_hash[offset:offset + 4])[0]
-    truncated &= 0x7FFFFFFF
+    # Top bit masked off, read straight from the digest without slicing
+    truncated = (
+        (hmac_hash[offset] & 0x7F) << 24
+        | hmac_hash[offset + 1] << 16
+        | hmac_hash[offset + 2] << 8
+        | hmac_hash[offset + 3]
+    )
 
     # Get 6-digit code
     code = truncated % 1000000
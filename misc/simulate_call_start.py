@@ -1,7 +1,14 @@
 # test_incoming_call.py
+# Single call:           python simulate_call_start.py
+# N concurrent calls:    python simulate_call_start.py --count N
+import argparse
+import asyncio
 import requests
 import time
 
+# One session for every request, so the connection to the local server is reused
+SESSION = requests.Session()
+
 def simulate_incoming_call(caller_phone="0415500152", caller_name="Test Caller"):
     """
     Simulate an incoming call by triggering the webhook
@@ -29,7 +36,7 @@ def simulate_incoming_call(caller_phone="0415500152", caller_name="Test Caller")
     
     try:
         # Make GET request to webhook
-        response = requests.get(webhook_url, params=params, timeout=10)
+        response = SESSION.get(webhook_url, params=params, timeout=10)
         
         print(f"\n✅ Webhook Response:")
         print(f"Status Code: {response.status_code}")
@@ -76,7 +83,7 @@ def simulate_call_ended(caller_phone="0415500152"):
     print("=" * 60)
     
     try:
-        response = requests.get(webhook_url, params=params, timeout=5)
+        response = SESSION.get(webhook_url, params=params, timeout=5)
         
         print(f"\n✅ End Webhook Response:")
         print(f"Status Code: {response.status_code}")
@@ -96,7 +103,7 @@ def simulate_call_ended(caller_phone="0415500152"):
 def check_server_status():
     """Check if Flask server is running"""
     try:
-        response = requests.get("http://127.0.0.1:5000/health", timeout=2)
+        response = SESSION.get("http://127.0.0.1:5000/health", timeout=2)
         if response.status_code == 200:
             print("✅ Flask server is running")
             return True
@@ -109,7 +116,63 @@ def check_server_status():
         return False
 
 
+async def simulate_many_calls(count, hold_seconds=5):
+    """
+    Fire `count` call-started webhooks at once, hold, then end them all at once
+
+    Args:
+        count: Number of simulated callers, each gets its own phone number
+        hold_seconds: How long the calls stay up before the end webhooks are sent
+    """
+    import aiohttp  # Only the stress test needs it
+
+    start_url = "http://127.0.0.1:5000/webhook/call-started"
+    end_url = "http://127.0.0.1:5000/webhook/call-ended"
+    # Sessions are keyed by caller number, so every simulated caller needs a different one
+    phones = [f"04{i:08d}" for i in range(count)]
+
+    async def send(session, url, params):
+        try:
+            async with session.get(url, params=params) as response:
+                return response.status
+        except Exception as e:
+            return repr(e)
+
+    def report(label, statuses):
+        ok = sum(1 for status in statuses if status == 200)
+        print(f"{label}: {ok}/{len(statuses)} OK")
+        for phone, status in zip(phones, statuses):
+            if status != 200:
+                print(f"  ❌ {phone}: {status}")
+
+    print("=" * 60)
+    print(f"🔔 SIMULATING {count} CONCURRENT CALLS")
+    print("=" * 60)
+
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        t0 = time.perf_counter()
+        statuses = await asyncio.gather(*[
+            send(session, start_url, {'call_id': f"Test Caller {i}", 'from': phone})
+            for i, phone in enumerate(phones)
+        ])
+        report(f"Started in {time.perf_counter() - t0:.2f}s", statuses)
+
+        await asyncio.sleep(hold_seconds)
+
+        t0 = time.perf_counter()
+        statuses = await asyncio.gather(*[send(session, end_url, {'from': phone}) for phone in phones])
+        report(f"Ended in {time.perf_counter() - t0:.2f}s", statuses)
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate 3CX call webhooks against the local server")
+    parser.add_argument("--count", type=int, default=1,
+                        help="Number of concurrent calls to simulate (default: 1, interactive)")
+    parser.add_argument("--hold", type=float, default=5,
+                        help="Seconds to keep concurrent calls up before ending them (default: 5)")
+    args = parser.parse_args()
+
     print("\n" + "=" * 60)
     print("CALL SIMULATION TEST")
     print("=" * 60)
@@ -117,6 +180,10 @@ if __name__ == "__main__":
     # Check if server is running
     if not check_server_status():
         exit(1)
+
+    if args.count > 1:
+        asyncio.run(simulate_many_calls(args.count, args.hold))
+        exit(0)
     
     # Simulate incoming call
     print("\n[1/2] Starting call simulation...")